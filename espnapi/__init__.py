@@ -5,6 +5,8 @@ A modern, async-enabled Python library for accessing ESPN sports data.
 
 __version__ = "0.1.0"
 
+import os
+
 from espnapi.client import ESPNClient, AsyncESPNClient
 from espnapi.config import ESPNConfig
 from espnapi.exceptions import (
@@ -20,4 +22,10 @@ __all__ = [
     "ESPNClientError",
     "ESPNNotFoundError",
     "ESPNRateLimitError",
-]
\ No newline at end of file
+]
+
+# Opt-in: ESPNAPI_USE_UVLOOP=1 switches asyncio to uvloop (pip install espnapi[uvloop])
+if os.environ.get("ESPNAPI_USE_UVLOOP") == "1":
+    from espnapi.utils import install_uvloop
+
+    install_uvloop()
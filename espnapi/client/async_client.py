@@ -1,15 +1,25 @@
 """Asynchronous ESPN API client."""
 
+import asyncio
+import weakref
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 import httpx
 import structlog
 
-from espnapi.client.base import BaseESPNClient, ESPNEndpointDomain, ESPNResponse
-from espnapi.client.retry import create_retry_config
+from espnapi.client.base import (
+    DEFAULT_ATHLETES_PARAMS,
+    DEFAULT_TEAMS_PARAMS,
+    BaseESPNClient,
+    ESPNEndpointDomain,
+    ESPNResponse,
+    QueryParams,
+    ScoreboardResponse,
+)
 from espnapi.config import ESPNConfig
 from espnapi.exceptions import ESPNClientError
+from espnapi.utils import format_espn_date
 
 from tenacity import AsyncRetrying, RetryError
 
@@ -36,22 +46,30 @@ class AsyncESPNClient(BaseESPNClient):
         """
         super().__init__(config)
         self._client: httpx.AsyncClient | None = None
+        self._async_retrying = AsyncRetrying(**self._retry_kwargs)
 
     @property
     async def client(self) -> httpx.AsyncClient:
         """Get or create async HTTP client (lazy initialization)."""
-        if self._client is None or self._client.is_closed is True:
+        # close() resets _client, so liveness is tracked without polling httpx
+        if self._client is None:
             self._client = httpx.AsyncClient(
                 timeout=httpx.Timeout(self.config.timeout),
                 headers={
                     "User-Agent": self.config.user_agent,
                     "Accept": "application/json",
                 },
-                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_max,
+                    max_keepalive_connections=self.config.pool_keepalive,
+                    keepalive_expiry=30.0,
+                ),
+                http2=self.config.enable_http2,
+                follow_redirects=self.config.follow_redirects,
             )
         return self._client
 
-    async def close(self) -> None:
+    async def close(self) -> None:  # type: ignore[override]
         """Close the HTTP client."""
         if self._client is not None:
             if self._client.is_closed is False:
@@ -79,20 +97,22 @@ class AsyncESPNClient(BaseESPNClient):
         self,
         method: str,
         url: str,
-        params: dict[str, Any] | None = None,
     ) -> ESPNResponse:
         """Make HTTP request with retry logic."""
-        retry_config = create_retry_config(self.config)
-        async_retrying = AsyncRetrying(**retry_config)
 
         async def _do_request() -> ESPNResponse:
-            logger.debug("espn_async_request", method=method, url=url, params=params)
+            if self._debug_enabled():
+                self._log.debug("espn_async_request", method=method, url=url)
             client = await self.client
-            response = await client.request(method, url, params=params)
+            response = await client.request(method, url)
             return self._handle_response(response, url)
 
+        # A single attempt needs no retry controller
+        if self.config.max_retries <= 1:
+            return await _do_request()
+
         try:
-            return await async_retrying(_do_request)
+            return await self._async_retrying(_do_request)
         except RetryError as e:
             logger.error(
                 "async_request_failed_after_retries",
@@ -102,26 +122,36 @@ class AsyncESPNClient(BaseESPNClient):
                 error=str(e),
             )
             # Re-raise the original exception
-            raise e.last_attempt.exception() from e
+            raise cast(BaseException, e.last_attempt.exception()) from e
 
     async def get(
         self,
         path: str,
         domain: ESPNEndpointDomain = ESPNEndpointDomain.SITE,
-        params: dict[str, Any] | None = None,
+        params: QueryParams | None = None,
     ) -> ESPNResponse:
         """Make GET request to ESPN API.
 
         Args:
             path: API path (e.g., "/apis/site/v2/sports/basketball/nba/scoreboard")
             domain: Which ESPN domain to use
-            params: Query parameters
+            params: Query parameters (mapping or sequence of pairs)
 
         Returns:
             ESPNResponse with parsed data
         """
         url = self._build_url(domain, path)
-        return await self._request_with_retry("GET", url, params=params)
+        if params:
+            url = self._append_query(url, params)
+        if self._cache is None:
+            return await self._request_with_retry("GET", url)
+
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+        response = await self._request_with_retry("GET", url)
+        self._cache.set(url, response)
+        return response
 
     # --------------------- Scoreboard Endpoints ---------------------
 
@@ -131,7 +161,7 @@ class AsyncESPNClient(BaseESPNClient):
         league: str,
         date: str | datetime | None = None,
         limit: int | None = None,
-    ) -> ESPNResponse:
+    ) -> ScoreboardResponse:
         """Get scoreboard/schedule for a sport and league.
 
         Args:
@@ -141,21 +171,23 @@ class AsyncESPNClient(BaseESPNClient):
             limit: Maximum number of events to return
 
         Returns:
-            ESPNResponse with scoreboard data
+            ScoreboardResponse with scoreboard data
         """
         path = f"/apis/site/v2/sports/{sport}/{league}/scoreboard"
         params: dict[str, Any] = {}
 
         if date:
             if isinstance(date, datetime):
-                date = date.strftime("%Y%m%d")
+                date = format_espn_date(date)
             params["dates"] = date
 
         if limit:
             params["limit"] = limit
 
-        logger.info("fetching_scoreboard", sport=sport, league=league, date=date)
-        return await self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
+        if self._debug_enabled():
+            self._log.debug("fetching_scoreboard", sport=sport, league=league, date=date)
+        response = await self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
+        return ScoreboardResponse.wrap(response)
 
     # --------------------- Team Endpoints ---------------------
 
@@ -171,9 +203,10 @@ class AsyncESPNClient(BaseESPNClient):
             ESPNResponse with teams data
         """
         path = f"/apis/site/v2/sports/{sport}/{league}/teams"
-        params = {"limit": limit}
+        params: QueryParams = DEFAULT_TEAMS_PARAMS if limit == 100 else {"limit": limit}
 
-        logger.info("fetching_teams", sport=sport, league=league)
+        if self._debug_enabled():
+            self._log.debug("fetching_teams", sport=sport, league=league)
         return await self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
 
     async def get_team(self, sport: str, league: str, team_id: str) -> ESPNResponse:
@@ -189,7 +222,8 @@ class AsyncESPNClient(BaseESPNClient):
         """
         path = f"/apis/site/v2/sports/{sport}/{league}/teams/{team_id}"
 
-        logger.info("fetching_team", sport=sport, league=league, team_id=team_id)
+        if self._debug_enabled():
+            self._log.debug("fetching_team", sport=sport, league=league, team_id=team_id)
         return await self.get(path, domain=ESPNEndpointDomain.SITE)
 
     # --------------------- Event/Game Endpoints ---------------------
@@ -208,7 +242,8 @@ class AsyncESPNClient(BaseESPNClient):
         path = f"/apis/site/v2/sports/{sport}/{league}/summary"
         params = {"event": event_id}
 
-        logger.info("fetching_event", sport=sport, league=league, event_id=event_id)
+        if self._debug_enabled():
+            self._log.debug("fetching_event", sport=sport, league=league, event_id=event_id)
         return await self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
 
     # --------------------- Core API Endpoints ---------------------
@@ -225,7 +260,8 @@ class AsyncESPNClient(BaseESPNClient):
         """
         path = f"/v2/sports/{sport}/leagues/{league}"
 
-        logger.info("fetching_league_info", sport=sport, league=league)
+        if self._debug_enabled():
+            self._log.debug("fetching_league_info", sport=sport, league=league)
         return await self.get(path, domain=ESPNEndpointDomain.CORE)
 
     async def get_athletes(
@@ -249,26 +285,103 @@ class AsyncESPNClient(BaseESPNClient):
             ESPNResponse with athletes data
         """
         path = f"/v2/sports/{sport}/leagues/{league}/athletes"
-        params: dict[str, Any] = {"limit": limit, "page": page}
-
+        params: QueryParams
         if team_id:
-            params["teams"] = team_id
-
-        logger.info("fetching_athletes", sport=sport, league=league, team_id=team_id)
+            params = {"limit": limit, "page": page, "teams": team_id}
+        elif limit == 100 and page == 1:
+            params = DEFAULT_ATHLETES_PARAMS
+        else:
+            params = {"limit": limit, "page": page}
+
+        if self._debug_enabled():
+            self._log.debug("fetching_athletes", sport=sport, league=league, team_id=team_id)
         return await self.get(path, domain=ESPNEndpointDomain.CORE, params=params)
 
+    async def get_all_athletes(
+        self,
+        sport: str,
+        league: str,
+        team_id: str | None = None,
+        limit: int = 100,
+        max_pages: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """Get athletes from every page of the core API.
 
-# Default singleton instance
-_default_async_client: AsyncESPNClient | None = None
+        The first page is fetched to learn the page count; the remaining pages
+        are then fetched concurrently, bounded by the keepalive pool size.
+
+        Args:
+            sport: Sport slug
+            league: League slug
+            team_id: Optional team ID to filter by
+            limit: Page size
+            max_pages: Optional cap on the number of pages fetched
+
+        Returns:
+            Athlete items from all fetched pages, in page order
+        """
+        first = await self.get_athletes(sport, league, team_id=team_id, limit=limit, page=1)
+        items: list[dict[str, Any]] = list(first.data.get("items", []))
+
+        page_count = int(first.data.get("pageCount", 1) or 1)
+        if max_pages is not None:
+            page_count = min(page_count, max_pages)
+        if page_count <= 1:
+            return items
+
+        semaphore = asyncio.Semaphore(max(1, self.config.pool_keepalive))
+
+        async def _fetch_page(page: int) -> ESPNResponse:
+            async with semaphore:
+                return await self.get_athletes(
+                    sport, league, team_id=team_id, limit=limit, page=page
+                )
+
+        pages = await asyncio.gather(*(_fetch_page(p) for p in range(2, page_count + 1)))
+        for response in pages:
+            items.extend(response.data.get("items", []))
+        return items
+
+
+# Default instances, one per running event loop: an httpx.AsyncClient's
+# connections belong to the loop that opened them
+_Loop = asyncio.AbstractEventLoop
+_default_async_clients: weakref.WeakKeyDictionary[_Loop, AsyncESPNClient] = (
+    weakref.WeakKeyDictionary()
+)
+_default_async_client_locks: weakref.WeakKeyDictionary[_Loop, asyncio.Lock] = (
+    weakref.WeakKeyDictionary()
+)
 
 
 async def get_async_espn_client() -> AsyncESPNClient:
-    """Get the default async ESPN client instance.
+    """Get the default async ESPN client instance for the running event loop.
+
+    The HTTP client is opened on first use in each event loop. Callers must
+    ``await close_async_espn_client()`` before that loop ends (e.g. at the end
+    of the coroutine passed to ``asyncio.run``) to release its connections.
 
     Returns:
-        AsyncESPNClient singleton instance
+        AsyncESPNClient singleton instance for the running loop
     """
-    global _default_async_client
-    if _default_async_client is None:
-        _default_async_client = AsyncESPNClient()
-    return _default_async_client
\ No newline at end of file
+    loop = asyncio.get_running_loop()
+    client = _default_async_clients.get(loop)
+    if client is None:
+        lock = _default_async_client_locks.setdefault(loop, asyncio.Lock())
+        async with lock:
+            client = _default_async_clients.get(loop)
+            if client is None:
+                client = AsyncESPNClient()
+                await client.__aenter__()
+                _default_async_clients[loop] = client
+    return client
+
+
+async def close_async_espn_client() -> None:
+    """Close and discard the default async ESPN client of the running event loop."""
+    loop = asyncio.get_running_loop()
+    lock = _default_async_client_locks.setdefault(loop, asyncio.Lock())
+    async with lock:
+        client = _default_async_clients.pop(loop, None)
+        if client is not None:
+            await client.close()
@@ -1,19 +1,95 @@
 """Base ESPN API client with shared logic."""
 
-from abc import ABC, abstractmethod
+import logging
 from dataclasses import dataclass
-from datetime import datetime
+from datetime import UTC, datetime
+from email.utils import parsedate_to_datetime
 from enum import Enum
-from typing import Any
+from functools import lru_cache
+from typing import Any, Callable, Mapping, NoReturn, Sequence
+from urllib.parse import urlencode
 
 import structlog
+from structlog.typing import FilteringBoundLogger
 
+from espnapi.client.cache import ResponseCache
+from espnapi.client.retry import create_retry_config
 from espnapi.config import ESPNConfig
 from espnapi.exceptions import ESPNClientError, ESPNNotFoundError, ESPNRateLimitError
+from espnapi.utils import json_loads
 
 logger = structlog.get_logger(__name__)
 
 
+def parse_retry_after(value: Any) -> float | None:
+    """Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delta-seconds or an HTTP-date
+
+    Returns:
+        Seconds to wait, or None if the header is missing or malformed
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=UTC)
+    return max(0.0, (retry_at - datetime.now(UTC)).total_seconds())
+
+
+# Query parameters: a mapping or a sequence of (key, value) pairs
+QueryParams = Mapping[str, Any] | Sequence[tuple[str, Any]]
+
+# Prebuilt params for the default-argument endpoint calls (no per-call dict)
+DEFAULT_TEAMS_PARAMS: tuple[tuple[str, Any], ...] = (("limit", 100),)
+DEFAULT_ATHLETES_PARAMS: tuple[tuple[str, Any], ...] = (("limit", 100), ("page", 1))
+
+
+def _query_value(value: Any) -> str:
+    """Stringify a query value the way httpx does (lowercase bools, None as empty)."""
+    if value is True:
+        return "true"
+    if value is False:
+        return "false"
+    if value is None:
+        return ""
+    return str(value)
+
+
+@lru_cache(maxsize=512)
+def _encode_query(items: tuple[tuple[str, str | tuple[str, ...]], ...]) -> str:
+    """Encode stringified (key, value) pairs into a query string, memoized per signature."""
+    return urlencode(items, doseq=True)
+
+
+def _raise_not_found(response: Any, url: str) -> NoReturn:
+    """Raise for a 404 response."""
+    logger.warning("espn_resource_not_found", url=url)
+    raise ESPNNotFoundError(f"ESPN resource not found: {url}")
+
+
+def _raise_rate_limited(response: Any, url: str) -> NoReturn:
+    """Raise for a 429 response, carrying the Retry-After delay."""
+    retry_after = parse_retry_after(response.headers.get("Retry-After"))
+    logger.warning("espn_rate_limited", url=url, retry_after=retry_after)
+    raise ESPNRateLimitError("ESPN API rate limit exceeded", retry_after=retry_after)
+
+
+# Status codes with dedicated handling; other 4xx/5xx fall through to generic errors
+_STATUS_HANDLERS: dict[int, Callable[[Any, str], NoReturn]] = {
+    404: _raise_not_found,
+    429: _raise_rate_limited,
+}
+
+
 class ESPNEndpointDomain(str, Enum):
     """ESPN API domain types."""
 
@@ -21,7 +97,7 @@ class ESPNEndpointDomain(str, Enum):
     CORE = "core"  # sports.core.api.espn.com
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ESPNResponse:
     """Wrapper for ESPN API responses."""
 
@@ -35,7 +111,28 @@ class ESPNResponse:
         return 200 <= self.status_code < 300
 
 
-class BaseESPNClient(ABC):
+@dataclass(slots=True, frozen=True)
+class ScoreboardResponse(ESPNResponse):
+    """ESPN scoreboard response with shortcuts into its event list."""
+
+    @classmethod
+    def wrap(cls, response: ESPNResponse) -> "ScoreboardResponse":
+        """Re-wrap a generic response without copying its data."""
+        return cls(response.data, response.status_code, response.url)
+
+    @property
+    def events(self) -> list[dict[str, Any]]:
+        """Events listed on the scoreboard."""
+        return self.data.get("events") or []
+
+    @property
+    def first_event_id(self) -> str | None:
+        """ID of the first scoreboard event, or None if there are no events."""
+        events = self.data.get("events")
+        return events[0].get("id") if events else None
+
+
+class BaseESPNClient:
     """Base ESPN API client with shared logic.
 
     This class provides the common functionality used by both sync and async clients,
@@ -51,6 +148,30 @@ class BaseESPNClient(ABC):
         self.config = config or ESPNConfig()
         self._validate_config()
 
+        # Child logger bound once; configure structlog before creating clients.
+        # Level checks stay live so debug logging can be toggled at runtime.
+        self._log: FilteringBoundLogger = logger.bind(component="espn_client")
+
+        # Config is frozen, so the tenacity parameters can be built once
+        self._retry_kwargs = create_retry_config(self.config)
+
+        self._cache: ResponseCache | None = None
+        if self.config.cache_ttl > 0:
+            self._cache = ResponseCache(self.config.cache_ttl, self.config.cache_maxsize)
+
+        self._json_loads: Callable[[bytes], Any] = (
+            self.config.json_module.loads if self.config.json_module is not None else json_loads
+        )
+
+        # Base URLs (with trailing slash) resolved once per client
+        self._base_urls = {
+            domain: self._get_base_url(domain).rstrip("/") + "/" for domain in ESPNEndpointDomain
+        }
+
+    def _debug_enabled(self) -> bool:
+        """Check whether debug logging is enabled for this client."""
+        return self._log.is_enabled_for(logging.DEBUG)
+
     def _validate_config(self) -> None:
         """Validate client configuration."""
         if self.config.timeout <= 0:
@@ -81,9 +202,35 @@ class BaseESPNClient(ABC):
         Returns:
             Full URL string
         """
-        base_url = self._get_base_url(domain)
-        path = path.lstrip("/")
-        return f"{base_url}/{path}"
+        return self._base_urls[domain] + path.lstrip("/")
+
+    def _append_query(self, url: str, params: QueryParams) -> str:
+        """Append encoded query parameters to a URL.
+
+        Pre-encoding lets the request skip httpx's per-call QueryParams handling.
+        Values are encoded as httpx would encode them.
+
+        Args:
+            url: Full URL, optionally already carrying a query string
+            params: Query parameters (mapping or sequence of pairs)
+
+        Returns:
+            URL with query string
+        """
+        pairs = params.items() if isinstance(params, Mapping) else params
+        items = tuple(
+            (
+                str(key),
+                (
+                    tuple(_query_value(v) for v in value)
+                    if isinstance(value, (list, tuple))
+                    else _query_value(value)
+                ),
+            )
+            for key, value in pairs
+        )
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}{_encode_query(items)}"
 
     def _handle_response(self, response: Any, url: str) -> ESPNResponse:
         """Handle HTTP response and convert to ESPNResponse.
@@ -100,51 +247,45 @@ class BaseESPNClient(ABC):
             ESPNRateLimitError: If rate limited (429)
             ESPNClientError: For other HTTP errors
         """
-        # Handle HTTP errors
-        if response.status_code == 404:
-            logger.warning("espn_resource_not_found", url=url)
-            raise ESPNNotFoundError(f"ESPN resource not found: {url}")
-
-        if response.status_code == 429:
-            logger.warning("espn_rate_limited", url=url)
-            raise ESPNRateLimitError("ESPN API rate limit exceeded")
+        # Handle HTTP errors (single comparison on the success path)
+        status_code = response.status_code
+        if status_code >= 400:
+            handler = _STATUS_HANDLERS.get(status_code)
+            if handler is not None:
+                handler(response, url)
+
+            if status_code >= 500:
+                logger.error(
+                    "espn_server_error",
+                    url=url,
+                    status_code=status_code,
+                )
+                raise ESPNClientError(f"ESPN server error: {status_code}")
 
-        if response.status_code >= 500:
-            logger.error(
-                "espn_server_error",
-                url=url,
-                status_code=response.status_code,
-            )
-            raise ESPNClientError(f"ESPN server error: {response.status_code}")
-
-        if response.status_code >= 400:
             logger.error(
                 "espn_client_error",
                 url=url,
-                status_code=response.status_code,
+                status_code=status_code,
             )
-            raise ESPNClientError(f"ESPN API error: {response.status_code}")
+            raise ESPNClientError(f"ESPN API error: {status_code}")
 
         # Parse JSON response
         try:
-            data = response.json()
+            data = self._json_loads(response.content)
         except Exception as e:
             logger.error("espn_json_parse_error", url=url, error=str(e))
             raise ESPNClientError(f"Failed to parse ESPN response: {e}") from e
 
-        return ESPNResponse(data=data, status_code=response.status_code, url=url)
+        return ESPNResponse(data=data, status_code=status_code, url=url)
 
-    @abstractmethod
     def close(self) -> None:
         """Close the HTTP client."""
         pass
 
-    @abstractmethod
     def __enter__(self) -> "BaseESPNClient":
         """Context manager entry."""
-        pass
+        return self
 
-    @abstractmethod
     def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
         """Context manager exit."""
-        pass
\ No newline at end of file
+        self.close()
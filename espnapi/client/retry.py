@@ -1,17 +1,21 @@
 """Retry logic and decorators for ESPN API client."""
 
 import asyncio
-from typing import Any, Callable, TypeVar
+from functools import lru_cache
+from typing import Any, Callable, TypeVar, cast
 
 import structlog
 from tenacity import (
     AsyncRetrying,
+    RetryCallState,
     RetryError,
     Retrying,
     retry_if_exception_type,
     stop_after_attempt,
     wait_exponential,
+    wait_random,
 )
+from tenacity.wait import wait_base
 
 from espnapi.config import ESPNConfig
 from espnapi.exceptions import ESPNClientError, ESPNRateLimitError
@@ -21,25 +25,64 @@ logger = structlog.get_logger(__name__)
 F = TypeVar("F", bound=Callable[..., Any])
 
 
+# Upper bound on a server-requested Retry-After delay
+MAX_RETRY_AFTER = 60.0
+
+
+class wait_retry_after(wait_base):
+    """Wait strategy that honors the server's Retry-After delay.
+
+    Uses ``retry_after`` from the last raised ESPNRateLimitError when present,
+    otherwise defers to the fallback strategy.
+    """
+
+    def __init__(self, fallback: wait_base, max_wait: float = MAX_RETRY_AFTER):
+        self.fallback = fallback
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        exc = retry_state.outcome.exception() if retry_state.outcome else None
+        retry_after = getattr(exc, "retry_after", None)
+        if retry_after is not None:
+            return float(min(retry_after, self.max_wait))
+        return self.fallback(retry_state)
+
+
+@lru_cache(maxsize=32)
+def _build_retry_config(
+    max_retries: int, retry_backoff: float, retry_jitter: float | None
+) -> dict[str, Any]:
+    jitter = retry_backoff if retry_jitter is None else retry_jitter
+
+    return {
+        "retry": retry_if_exception_type((ESPNClientError, ESPNRateLimitError)),
+        "stop": stop_after_attempt(max_retries),
+        # Random jitter keeps concurrent callers from retrying in lockstep
+        "wait": wait_retry_after(
+            wait_exponential(
+                multiplier=retry_backoff,
+                min=retry_backoff,
+                max=10.0,
+            )
+            + wait_random(0, jitter)
+        ),
+        "reraise": True,
+    }
+
+
 def create_retry_config(config: ESPNConfig) -> dict[str, Any]:
     """Create tenacity retry configuration from ESPN config.
 
+    The stateless tenacity strategies are built once per distinct retry
+    setting and shared; callers get a fresh dict they may modify.
+
     Args:
         config: ESPN configuration
 
     Returns:
         Dict with tenacity retry parameters
     """
-    return {
-        "retry": retry_if_exception_type((ESPNClientError, ESPNRateLimitError)),
-        "stop": stop_after_attempt(config.max_retries),
-        "wait": wait_exponential(
-            multiplier=config.retry_backoff,
-            min=config.retry_backoff,
-            max=10.0,
-        ),
-        "reraise": True,
-    }
+    return dict(_build_retry_config(config.max_retries, config.retry_backoff, config.retry_jitter))
 
 
 def retry_request(config: ESPNConfig) -> Callable[[F], F]:
@@ -67,7 +110,7 @@ def retry_request(config: ESPNConfig) -> Callable[[F], F]:
                     error=str(e),
                 )
                 # Re-raise the original exception
-                raise e.last_attempt.exception() from e
+                raise cast(BaseException, e.last_attempt.exception()) from e
 
         return wrapper  # type: ignore
 
@@ -99,7 +142,7 @@ def async_retry_request(config: ESPNConfig) -> Callable[[F], F]:
                     error=str(e),
                 )
                 # Re-raise the original exception
-                raise e.last_attempt.exception() from e
+                raise cast(BaseException, e.last_attempt.exception()) from e
 
         return wrapper  # type: ignore
 
@@ -1,15 +1,25 @@
 """Synchronous ESPN API client."""
 
+import atexit
+import threading
 from datetime import datetime
-from typing import Any
+from typing import Any, cast
 
 import httpx
 import structlog
 
-from espnapi.client.base import BaseESPNClient, ESPNEndpointDomain, ESPNResponse
-from espnapi.client.retry import create_retry_config
+from espnapi.client.base import (
+    DEFAULT_ATHLETES_PARAMS,
+    DEFAULT_TEAMS_PARAMS,
+    BaseESPNClient,
+    ESPNEndpointDomain,
+    ESPNResponse,
+    QueryParams,
+    ScoreboardResponse,
+)
 from espnapi.config import ESPNConfig
 from espnapi.exceptions import ESPNClientError
+from espnapi.utils import format_espn_date
 
 from tenacity import RetryError, Retrying
 
@@ -36,18 +46,26 @@ class ESPNClient(BaseESPNClient):
         """
         super().__init__(config)
         self._client: httpx.Client | None = None
+        self._retrying = Retrying(**self._retry_kwargs)
 
     @property
     def client(self) -> httpx.Client:
         """Get or create HTTP client (lazy initialization)."""
-        if self._client is None or self._client.is_closed is True:
+        # close() resets _client, so liveness is tracked without polling httpx
+        if self._client is None:
             self._client = httpx.Client(
                 timeout=httpx.Timeout(self.config.timeout),
                 headers={
                     "User-Agent": self.config.user_agent,
                     "Accept": "application/json",
                 },
-                follow_redirects=True,
+                limits=httpx.Limits(
+                    max_connections=self.config.pool_max,
+                    max_keepalive_connections=self.config.pool_keepalive,
+                    keepalive_expiry=30.0,
+                ),
+                http2=self.config.enable_http2,
+                follow_redirects=self.config.follow_redirects,
             )
         return self._client
 
@@ -71,19 +89,21 @@ class ESPNClient(BaseESPNClient):
         self,
         method: str,
         url: str,
-        params: dict[str, Any] | None = None,
     ) -> ESPNResponse:
         """Make HTTP request with retry logic."""
-        retry_config = create_retry_config(self.config)
-        retrying = Retrying(**retry_config)
 
         def _do_request() -> ESPNResponse:
-            logger.debug("espn_request", method=method, url=url, params=params)
-            response = self.client.request(method, url, params=params)
+            if self._debug_enabled():
+                self._log.debug("espn_request", method=method, url=url)
+            response = self.client.request(method, url)
             return self._handle_response(response, url)
 
+        # A single attempt needs no retry controller
+        if self.config.max_retries <= 1:
+            return _do_request()
+
         try:
-            return retrying(_do_request)
+            return self._retrying(_do_request)
         except RetryError as e:
             logger.error(
                 "request_failed_after_retries",
@@ -93,26 +113,36 @@ class ESPNClient(BaseESPNClient):
                 error=str(e),
             )
             # Re-raise the original exception
-            raise e.last_attempt.exception() from e
+            raise cast(BaseException, e.last_attempt.exception()) from e
 
     def get(
         self,
         path: str,
         domain: ESPNEndpointDomain = ESPNEndpointDomain.SITE,
-        params: dict[str, Any] | None = None,
+        params: QueryParams | None = None,
     ) -> ESPNResponse:
         """Make GET request to ESPN API.
 
         Args:
             path: API path (e.g., "/apis/site/v2/sports/basketball/nba/scoreboard")
             domain: Which ESPN domain to use
-            params: Query parameters
+            params: Query parameters (mapping or sequence of pairs)
 
         Returns:
             ESPNResponse with parsed data
         """
         url = self._build_url(domain, path)
-        return self._request_with_retry("GET", url, params=params)
+        if params:
+            url = self._append_query(url, params)
+        if self._cache is None:
+            return self._request_with_retry("GET", url)
+
+        cached = self._cache.get(url)
+        if cached is not None:
+            return cached
+        response = self._request_with_retry("GET", url)
+        self._cache.set(url, response)
+        return response
 
     # --------------------- Scoreboard Endpoints ---------------------
 
@@ -122,7 +152,7 @@ class ESPNClient(BaseESPNClient):
         league: str,
         date: str | datetime | None = None,
         limit: int | None = None,
-    ) -> ESPNResponse:
+    ) -> ScoreboardResponse:
         """Get scoreboard/schedule for a sport and league.
 
         Args:
@@ -132,21 +162,23 @@ class ESPNClient(BaseESPNClient):
             limit: Maximum number of events to return
 
         Returns:
-            ESPNResponse with scoreboard data
+            ScoreboardResponse with scoreboard data
         """
         path = f"/apis/site/v2/sports/{sport}/{league}/scoreboard"
         params: dict[str, Any] = {}
 
         if date:
             if isinstance(date, datetime):
-                date = date.strftime("%Y%m%d")
+                date = format_espn_date(date)
             params["dates"] = date
 
         if limit:
             params["limit"] = limit
 
-        logger.info("fetching_scoreboard", sport=sport, league=league, date=date)
-        return self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
+        if self._debug_enabled():
+            self._log.debug("fetching_scoreboard", sport=sport, league=league, date=date)
+        response = self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
+        return ScoreboardResponse.wrap(response)
 
     # --------------------- Team Endpoints ---------------------
 
@@ -162,9 +194,10 @@ class ESPNClient(BaseESPNClient):
             ESPNResponse with teams data
         """
         path = f"/apis/site/v2/sports/{sport}/{league}/teams"
-        params = {"limit": limit}
+        params: QueryParams = DEFAULT_TEAMS_PARAMS if limit == 100 else {"limit": limit}
 
-        logger.info("fetching_teams", sport=sport, league=league)
+        if self._debug_enabled():
+            self._log.debug("fetching_teams", sport=sport, league=league)
         return self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
 
     def get_team(self, sport: str, league: str, team_id: str) -> ESPNResponse:
@@ -180,7 +213,8 @@ class ESPNClient(BaseESPNClient):
         """
         path = f"/apis/site/v2/sports/{sport}/{league}/teams/{team_id}"
 
-        logger.info("fetching_team", sport=sport, league=league, team_id=team_id)
+        if self._debug_enabled():
+            self._log.debug("fetching_team", sport=sport, league=league, team_id=team_id)
         return self.get(path, domain=ESPNEndpointDomain.SITE)
 
     # --------------------- Event/Game Endpoints ---------------------
@@ -199,7 +233,8 @@ class ESPNClient(BaseESPNClient):
         path = f"/apis/site/v2/sports/{sport}/{league}/summary"
         params = {"event": event_id}
 
-        logger.info("fetching_event", sport=sport, league=league, event_id=event_id)
+        if self._debug_enabled():
+            self._log.debug("fetching_event", sport=sport, league=league, event_id=event_id)
         return self.get(path, domain=ESPNEndpointDomain.SITE, params=params)
 
     # --------------------- Core API Endpoints ---------------------
@@ -216,7 +251,8 @@ class ESPNClient(BaseESPNClient):
         """
         path = f"/v2/sports/{sport}/leagues/{league}"
 
-        logger.info("fetching_league_info", sport=sport, league=league)
+        if self._debug_enabled():
+            self._log.debug("fetching_league_info", sport=sport, league=league)
         return self.get(path, domain=ESPNEndpointDomain.CORE)
 
     def get_athletes(
@@ -240,26 +276,38 @@ class ESPNClient(BaseESPNClient):
             ESPNResponse with athletes data
         """
         path = f"/v2/sports/{sport}/leagues/{league}/athletes"
-        params: dict[str, Any] = {"limit": limit, "page": page}
-
+        params: QueryParams
         if team_id:
-            params["teams"] = team_id
-
-        logger.info("fetching_athletes", sport=sport, league=league, team_id=team_id)
+            params = {"limit": limit, "page": page, "teams": team_id}
+        elif limit == 100 and page == 1:
+            params = DEFAULT_ATHLETES_PARAMS
+        else:
+            params = {"limit": limit, "page": page}
+
+        if self._debug_enabled():
+            self._log.debug("fetching_athletes", sport=sport, league=league, team_id=team_id)
         return self.get(path, domain=ESPNEndpointDomain.CORE, params=params)
 
 
 # Default singleton instance
 _default_client: ESPNClient | None = None
+_default_client_lock = threading.Lock()
 
 
 def get_espn_client() -> ESPNClient:
     """Get the default ESPN client instance.
 
+    The HTTP client is opened on first use and closed at interpreter exit.
+
     Returns:
         ESPNClient singleton instance
     """
     global _default_client
     if _default_client is None:
-        _default_client = ESPNClient()
-    return _default_client
\ No newline at end of file
+        with _default_client_lock:
+            if _default_client is None:
+                client = ESPNClient()
+                client.__enter__()
+                atexit.register(client.close)
+                _default_client = client
+    return _default_client
@@ -1,9 +1,10 @@
 """ESPN API client configuration."""
 
 from dataclasses import dataclass
+from types import ModuleType
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ESPNConfig:
     """Configuration for ESPN API client."""
 
@@ -15,6 +16,24 @@ class ESPNConfig:
     timeout: float = 30.0
     max_retries: int = 3
     retry_backoff: float = 1.0
+    # Upper bound of the random jitter added to each backoff (None = retry_backoff)
+    retry_jitter: float | None = None
+
+    # Connection pooling
+    pool_max: int = 100
+    pool_keepalive: int = 20
+    enable_http2: bool = True
+
+    # ESPN endpoints answer directly; enable only for proxies/mirrors that redirect
+    follow_redirects: bool = False
+
+    # Response caching (seconds; 0 disables)
+    cache_ttl: float = 0.0
+    cache_maxsize: int = 1024
+
+    # Module whose loads() decodes response bodies (e.g. orjson, json);
+    # None uses orjson when installed, otherwise the stdlib json module
+    json_module: ModuleType | None = None
 
     # Headers
     user_agent: str = "espnapi/0.1.0"
@@ -31,6 +50,20 @@ class ESPNConfig:
             raise ValueError("max_retries must be non-negative")
         if self.retry_backoff <= 0:
             raise ValueError("retry_backoff must be positive")
+        if self.retry_jitter is not None and self.retry_jitter < 0:
+            raise ValueError("retry_jitter must be non-negative")
+        if self.pool_max <= 0:
+            raise ValueError("pool_max must be positive")
+        if self.pool_keepalive < 0:
+            raise ValueError("pool_keepalive must be non-negative")
+        if self.cache_ttl < 0:
+            raise ValueError("cache_ttl must be non-negative")
+        if self.cache_maxsize <= 0:
+            raise ValueError("cache_maxsize must be positive")
+        if self.json_module is not None and not callable(
+            getattr(self.json_module, "loads", None)
+        ):
+            raise ValueError("json_module must provide a loads() function")
         if self.rate_limit_requests <= 0:
             raise ValueError("rate_limit_requests must be positive")
         if self.rate_limit_period <= 0:
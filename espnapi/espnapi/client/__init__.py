@@ -1,6 +0,0 @@
-"""ESPN API client module."""
-
-from espnapi.client.sync import ESPNClient
-from espnapi.client.async_client import AsyncESPNClient
-
-__all__ = ["ESPNClient", "AsyncESPNClient"]
\ No newline at end of file
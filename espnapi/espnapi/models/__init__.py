@@ -1,19 +0,0 @@
-"""ESPN data models."""
-
-from espnapi.models.base import ESPNModel
-from espnapi.models.sport import Sport, League
-from espnapi.models.team import Team
-from espnapi.models.event import Event, Competitor
-from espnapi.models.venue import Venue
-from espnapi.models.athlete import Athlete
-
-__all__ = [
-    "ESPNModel",
-    "Sport",
-    "League",
-    "Team",
-    "Event",
-    "Competitor",
-    "Venue",
-    "Athlete",
-]
\ No newline at end of file
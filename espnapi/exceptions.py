@@ -17,9 +17,15 @@ class ESPNClientError(ESPNServiceError):
 
 
 class ESPNRateLimitError(ESPNClientError):
-    """ESPN API rate limit exceeded."""
+    """ESPN API rate limit exceeded.
 
-    pass
+    Attributes:
+        retry_after: Seconds the server asked us to wait (from Retry-After), if provided
+    """
+
+    def __init__(self, message: str, retry_after: float | None = None):
+        super().__init__(message)
+        self.retry_after = retry_after
 
 
 class ESPNNotFoundError(ESPNClientError):
@@ -1,12 +1,35 @@
 """Athlete model for espnapi."""
 
 from datetime import date
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
-from espnapi.models.base import ESPNModel, Link
+from espnapi.models.base import ESPNModel, Link, map_fields, model_list_adapter
 from espnapi.models.team import Team
+from espnapi.utils import path
+
+_POSITION_NAME = path("position", "name")
+_POSITION_ABBR = path("position", "abbreviation")
+_BIRTH_CITY = path("birthPlace", "city")
+_HEADSHOT_HREF = path("headshot", "href")
+
+# ESPN athlete keys copied verbatim onto Athlete fields
+_ATHLETE_FIELD_MAP = {
+    "uid": "uid",
+    "firstName": "first_name",
+    "lastName": "last_name",
+    "fullName": "full_name",
+    "displayName": "display_name",
+    "shortName": "short_name",
+    "jersey": "jersey",
+    "active": "is_active",
+    "height": "height",
+    "weight": "weight",
+    "age": "age",
+    "dateOfBirth": "birth_date",
+}
+_ATHLETE_DEFAULTS = {"first_name": "", "last_name": "", "full_name": "", "display_name": ""}
 
 
 class Athlete(ESPNModel):
@@ -49,7 +72,8 @@ class Athlete(ESPNModel):
 
     def __str__(self) -> str:
         """String representation."""
-        team_abbr = self.team.abbreviation if self.team else "FA"
+        team = self.team
+        team_abbr = team.abbreviation if team else "FA"
         return f"{self.display_name} ({team_abbr})"
 
     @property
@@ -67,8 +91,45 @@ class Athlete(ESPNModel):
         """Get position for display."""
         return self.position_abbreviation or self.position or "Unknown"
 
+    @staticmethod
+    def _normalize(data: Dict[str, Any], team: Optional[Team]) -> Dict[str, Any]:
+        """Map raw ESPN athlete data onto Athlete field names."""
+        # Handle nested athlete data
+        athlete_data = data.get("athlete", data)
+
+        fields = map_fields(athlete_data, _ATHLETE_FIELD_MAP, _ATHLETE_DEFAULTS)
+        fields["espn_id"] = str(athlete_data.get("id", ""))
+        fields["team"] = team
+        fields["position"] = _POSITION_NAME(athlete_data)
+        fields["position_abbreviation"] = _POSITION_ABBR(athlete_data)
+        fields["birth_place"] = _BIRTH_CITY(athlete_data)
+        fields["headshot"] = _HEADSHOT_HREF(athlete_data)
+        fields["links"] = [
+            link for link in athlete_data.get("links") or () if isinstance(link, dict)
+        ]
+        fields["raw_data"] = athlete_data
+        return fields
+
     @classmethod
-    def from_espn_data(cls, data: dict, team: Optional[Team] = None) -> "Athlete":
+    def from_espn_data_many(
+        cls, rows: List[Dict[str, Any]], team: Optional[Team] = None
+    ) -> List["Athlete"]:
+        """Create Athlete instances from a list of ESPN API athlete data.
+
+        All rows are validated in a single pass.
+
+        Args:
+            rows: Raw athlete data items from ESPN API
+            team: Current team shared by all rows (if known)
+
+        Returns:
+            List of Athlete instances
+        """
+        normalized = [cls._normalize(row, team) for row in rows]
+        return model_list_adapter(cls).validate_python(normalized)
+
+    @classmethod
+    def from_espn_data(cls, data: Dict[str, Any], team: Optional[Team] = None) -> "Athlete":
         """Create Athlete instance from ESPN API data.
 
         Args:
@@ -78,35 +139,8 @@ class Athlete(ESPNModel):
         Returns:
             Athlete instance
         """
-        # Handle nested athlete data
-        athlete_data = data.get("athlete", data)
+        return cls.from_espn_data_many([data], team)[0]
+
 
-        # Convert links
-        links = []
-        if athlete_data.get("links"):
-            for link_data in athlete_data["links"]:
-                if isinstance(link_data, dict):
-                    links.append(Link(**link_data))
-
-        return cls(
-            espn_id=str(athlete_data.get("id", "")),
-            uid=athlete_data.get("uid"),
-            first_name=athlete_data.get("firstName", ""),
-            last_name=athlete_data.get("lastName", ""),
-            full_name=athlete_data.get("fullName", ""),
-            display_name=athlete_data.get("displayName", ""),
-            short_name=athlete_data.get("shortName"),
-            team=team,
-            position=athlete_data.get("position", {}).get("name"),
-            position_abbreviation=athlete_data.get("position", {}).get("abbreviation"),
-            jersey=athlete_data.get("jersey"),
-            is_active=athlete_data.get("active", True),
-            height=athlete_data.get("height"),
-            weight=athlete_data.get("weight"),
-            age=athlete_data.get("age"),
-            birth_date=athlete_data.get("dateOfBirth"),
-            birth_place=athlete_data.get("birthPlace", {}).get("city"),
-            headshot=athlete_data.get("headshot", {}).get("href"),
-            links=links,
-            raw_data=athlete_data,
-        )
\ No newline at end of file
+# Build batch validators at import instead of on the first parsed response
+model_list_adapter(Athlete)
@@ -1,9 +1,10 @@
 """Base Pydantic models for espnapi."""
 
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, ClassVar, Dict, List, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, SkipValidation, TypeAdapter
 
 
 class ESPNModel(BaseModel):
@@ -14,19 +15,19 @@ class ESPNModel(BaseModel):
 
     model_config = ConfigDict(
         populate_by_name=True,
-        validate_assignment=True,
-        extra="allow",  # Allow extra fields for extensibility
+        validate_assignment=False,  # Models are built once from API data, then read
+        extra="ignore",  # Subclasses may opt into "allow" for free-form fields
     )
 
-    # Store raw data for debugging/extensibility
-    raw_data: Optional[Dict[str, Any]] = Field(default=None, exclude=True)
+    # Store raw data for debugging/extensibility (kept by reference, not copied)
+    raw_data: SkipValidation[Optional[Dict[str, Any]]] = Field(default=None, exclude=True)
 
     def model_post_init(self, __context: Any) -> None:
         """Called after model initialization."""
-        # Store raw data if not already set
-        if hasattr(self, "__pydantic_extra__") and self.__pydantic_extra__:
-            if self.raw_data is None:
-                self.raw_data = dict(self.__pydantic_extra__)
+        # Expose extra fields as raw data if not already set
+        if self.raw_data is None and self.__pydantic_extra__:
+            # Bypass __setattr__ so frozen subclasses can store it too
+            self.__dict__["raw_data"] = self.__pydantic_extra__
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ESPNModel":
@@ -61,17 +62,72 @@ class ESPNModel(BaseModel):
         return self.__str__()
 
 
-class Link(ESPNModel):
+def map_fields(
+    data: Dict[str, Any], field_map: Dict[str, str], defaults: Dict[str, Any]
+) -> Dict[str, Any]:
+    """Rename ESPN payload keys to model field names in a single pass.
+
+    Args:
+        data: Raw ESPN API data
+        field_map: ESPN key to model field name mapping
+        defaults: Field values used when the ESPN key is absent
+
+    Returns:
+        Dictionary of model field values
+    """
+    fields = dict(defaults)
+    for key, value in data.items():
+        field = field_map.get(key)
+        if field is not None:
+            fields[field] = value
+    return fields
+
+
+@lru_cache(maxsize=None)
+def model_list_adapter(model: type) -> TypeAdapter[List[Any]]:
+    """Get a cached TypeAdapter that validates a list of model instances.
+
+    Validating a whole list through one adapter avoids per-row model
+    construction overhead when ingesting many records at once.
+
+    Args:
+        model: Model class to validate
+
+    Returns:
+        TypeAdapter for List[model]
+    """
+    return TypeAdapter(List[model])  # type: ignore[valid-type]
+
+
+class _LeafESPNModel(ESPNModel):
+    """Base for small value models embedded in bulk inside other models.
+
+    Leaf models are immutable, carry no raw_data field and declare empty
+    __slots__ so they add no per-instance attributes of their own.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True, validate_assignment=False)
+
+    __slots__ = ()
+
+    raw_data: ClassVar[None] = None  # type: ignore[misc]
+
+
+class Link(_LeafESPNModel):
     """Link model for ESPN API links."""
 
+    __slots__ = ()
+
     rel: List[str] = Field(default_factory=list)
     href: str
     text: Optional[str] = None
 
 
-class Logo(ESPNModel):
+class Logo(_LeafESPNModel):
     """Logo model for team/organization logos."""
 
+    __slots__ = ()
+
     href: str
     width: Optional[int] = None
     height: Optional[int] = None
@@ -80,18 +136,22 @@ class Logo(ESPNModel):
     last_updated: Optional[datetime] = None
 
 
-class Address(ESPNModel):
+class Address(_LeafESPNModel):
     """Address model for venue/location addresses."""
 
+    __slots__ = ()
+
     city: Optional[str] = None
     state: Optional[str] = None
     country: Optional[str] = None
     zip_code: Optional[str] = None
 
 
-class Record(ESPNModel):
+class Record(_LeafESPNModel):
     """Record model for team/athlete records."""
 
+    __slots__ = ()
+
     type: str
     summary: Optional[str] = None
     display_value: Optional[str] = None
@@ -99,9 +159,11 @@ class Record(ESPNModel):
     rank: Optional[int] = None
 
 
-class Statistic(ESPNModel):
+class Statistic(_LeafESPNModel):
     """Statistic model for game/season stats."""
 
+    __slots__ = ()
+
     name: str
     display_name: Optional[str] = None
     short_display_name: Optional[str] = None
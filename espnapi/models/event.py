@@ -2,14 +2,28 @@
 
 from datetime import datetime
 from enum import Enum
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
-from espnapi.models.base import ESPNModel, Link, Record, Statistic
+from espnapi.models.base import (
+    ESPNModel,
+    Link,
+    Record,
+    Statistic,
+    map_fields,
+    model_list_adapter,
+)
 from espnapi.models.sport import League
 from espnapi.models.team import Team
 from espnapi.models.venue import Venue
+from espnapi.utils import json_loads, parse_datetime, path
+
+_STATUS_STATE = path("status", "type", "state", default="pre")
+_STATUS_DETAIL = path("status", "type", "detail")
+_STATUS_CLOCK = path("status", "displayClock")
+_STATUS_PERIOD = path("status", "period")
+_WEEK_NUMBER = path("week", "number")
 
 
 class EventStatus(str, Enum):
@@ -21,6 +35,40 @@ class EventStatus(str, Enum):
     POSTPONED = "postponed"
     CANCELLED = "cancelled"
 
+    @classmethod
+    def lookup(cls, value: str, default: "EventStatus | None" = None) -> "EventStatus":
+        """Get the status for a value without raising on unknown values.
+
+        Args:
+            value: Status value (e.g., "final")
+            default: Status for unknown values (defaults to SCHEDULED)
+
+        Returns:
+            Matching EventStatus, or the default
+        """
+        status = _STATUS_LOOKUP.get(value)
+        if status is None:
+            return default or cls.SCHEDULED
+        return status  # type: ignore[return-value]
+
+
+_STATUS_LOOKUP = EventStatus._value2member_map_
+_COMPLETED_STATES = frozenset({EventStatus.FINAL, EventStatus.CANCELLED})
+
+# ESPN status.type.state values
+_STATUS_MAP: Dict[str, EventStatus] = {
+    "pre": EventStatus.SCHEDULED,
+    "in": EventStatus.IN_PROGRESS,
+    "post": EventStatus.FINAL,
+}
+
+# ESPN event keys copied verbatim onto Event fields
+_EVENT_FIELD_MAP = {"uid": "uid", "name": "name", "shortName": "short_name"}
+_EVENT_DEFAULTS = {"name": ""}
+
+_HOME = "home"
+_AWAY = "away"
+
 
 class Event(ESPNModel):
     """Event/game entity representing a sports event."""
@@ -64,7 +112,7 @@ class Event(ESPNModel):
     @property
     def is_completed(self) -> bool:
         """Check if event is completed."""
-        return self.status in [EventStatus.FINAL, EventStatus.CANCELLED]
+        return self.status in _COMPLETED_STATES
 
     @property
     def is_live(self) -> bool:
@@ -78,8 +126,54 @@ class Event(ESPNModel):
             return self.status_detail
         return self.status.value.replace("_", " ").lower()
 
+    @staticmethod
+    def _normalize(data: Dict[str, Any], league: League) -> Dict[str, Any]:
+        """Map raw ESPN event data onto Event field names."""
+        # Parse status
+        status = _STATUS_MAP.get(_STATUS_STATE(data), EventStatus.SCHEDULED)
+
+        date = data.get("date", "")
+        if not isinstance(date, datetime):
+            date = parse_datetime(date)
+
+        # Parse season info
+        season_data = data.get("season", {})
+
+        fields = map_fields(data, _EVENT_FIELD_MAP, _EVENT_DEFAULTS)
+        fields["league"] = league
+        fields["espn_id"] = str(data.get("id", ""))
+        fields["date"] = date
+        fields["season_year"] = season_data.get("year", date.year)
+        fields["season_type"] = season_data.get("type", 2)
+        fields["season_slug"] = season_data.get("slug")
+        fields["week"] = _WEEK_NUMBER(data)
+        fields["status"] = status
+        fields["status_detail"] = _STATUS_DETAIL(data)
+        fields["clock"] = _STATUS_CLOCK(data)
+        fields["period"] = _STATUS_PERIOD(data)
+        # attendance and broadcasts are set from competition data
+        fields["links"] = [link for link in data.get("links") or () if isinstance(link, dict)]
+        fields["raw_data"] = data
+        return fields
+
+    @classmethod
+    def from_espn_data_many(cls, rows: List[Dict[str, Any]], league: League) -> List["Event"]:
+        """Create Event instances from a list of ESPN API event data.
+
+        All rows are validated in a single pass.
+
+        Args:
+            rows: Raw event data items from ESPN API
+            league: League these events belong to
+
+        Returns:
+            List of Event instances
+        """
+        normalized = [cls._normalize(row, league) for row in rows]
+        return model_list_adapter(cls).validate_python(normalized)
+
     @classmethod
-    def from_espn_data(cls, data: dict, league: League) -> "Event":
+    def from_espn_data(cls, data: Dict[str, Any], league: League) -> "Event":
         """Create Event instance from ESPN API data.
 
         Args:
@@ -89,54 +183,35 @@ class Event(ESPNModel):
         Returns:
             Event instance
         """
-        # Parse status
-        status_data = data.get("status", {})
-        type_data = status_data.get("type", {})
+        return cls.from_espn_data_many([data], league)[0]
 
-        status_map = {
-            "pre": EventStatus.SCHEDULED,
-            "in": EventStatus.IN_PROGRESS,
-            "post": EventStatus.FINAL,
-        }
-        status = status_map.get(type_data.get("state", "pre"), EventStatus.SCHEDULED)
+    @classmethod
+    def from_espn_json(cls, raw: bytes | str, league: League) -> "Event":
+        """Create Event instance from a raw ESPN API JSON body.
 
-        # Parse date
-        date_str = data.get("date", "")
-        try:
-            date = datetime.fromisoformat(date_str.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            date = datetime.now()
+        Decodes bytes directly (via orjson when installed) without
+        materializing an intermediate str.
 
-        # Parse season info
-        season_data = data.get("season", {})
+        Args:
+            raw: Raw JSON event body from ESPN API
+            league: League this event belongs to
+
+        Returns:
+            Event instance
+        """
+        return cls.from_espn_data(json_loads(raw), league)
 
-        # Convert links
-        links = []
-        if data.get("links"):
-            for link_data in data["links"]:
-                if isinstance(link_data, dict):
-                    links.append(Link(**link_data))
-
-        return cls(
-            league=league,
-            espn_id=str(data.get("id", "")),
-            uid=data.get("uid"),
-            date=date,
-            name=data.get("name", ""),
-            short_name=data.get("shortName"),
-            season_year=season_data.get("year", date.year),
-            season_type=season_data.get("type", 2),
-            season_slug=season_data.get("slug"),
-            week=data.get("week", {}).get("number"),
-            status=status,
-            status_detail=type_data.get("detail"),
-            clock=status_data.get("displayClock"),
-            period=status_data.get("period"),
-            attendance=None,  # Will be set from competition data
-            broadcasts=[],    # Will be set from competition data
-            links=links,
-            raw_data=data,
-        )
+
+def _parse_score(score: str) -> Optional[int]:
+    """Parse a score string, avoiding exceptions for the common cases."""
+    if not score:
+        return None
+    if score.isdecimal():
+        return int(score)
+    try:
+        return int(score)
+    except ValueError:
+        return None
 
 
 class Competitor(ESPNModel):
@@ -164,32 +239,66 @@ class Competitor(ESPNModel):
 
     def __str__(self) -> str:
         """String representation."""
-        if hasattr(self.event, 'short_name') and hasattr(self.event, 'name'):
-            event_name = self.event.short_name or self.event.name
-        else:
-            event_name = str(self.event)
+        event = self.event
+        event_name = event.short_name or event.name or str(event)
         return f"{self.team.abbreviation} ({self.home_away}) - {event_name}"
 
     @property
     def score_int(self) -> Optional[int]:
         """Get score as integer."""
-        try:
-            return int(self.score) if self.score else None
-        except ValueError:
-            return None
+        return _parse_score(self.score)
 
     @property
     def is_home(self) -> bool:
         """Check if this is the home team."""
-        return self.home_away == "home"
+        return self.home_away == _HOME
 
     @property
     def is_away(self) -> bool:
         """Check if this is the away team."""
-        return self.home_away == "away"
+        return self.home_away == _AWAY
+
+    @staticmethod
+    def _normalize(data: Dict[str, Any], event: Event, league: League) -> Dict[str, Any]:
+        """Map raw ESPN competitor data onto Competitor field names."""
+        team_data = data.get("team", {})
+
+        return {
+            "event": event,
+            # Create team if we don't have it
+            "team": Team._normalize({"team": team_data}, league),
+            "home_away": data.get("homeAway", _AWAY),
+            "score": data.get("score", ""),
+            "winner": data.get("winner"),
+            "line_scores": data.get("linescores", []),
+            "records": [r for r in data.get("records") or () if isinstance(r, dict)],
+            "statistics": [s for s in data.get("statistics") or () if isinstance(s, dict)],
+            "leaders": data.get("leaders", []),
+            "order": data.get("order", 0),
+            "raw_data": data,
+        }
 
     @classmethod
-    def from_espn_data(cls, data: dict, event: Event, league: League) -> "Competitor":
+    def from_espn_data_many(
+        cls, rows: List[Dict[str, Any]], event: Event, league: League
+    ) -> List["Competitor"]:
+        """Create Competitor instances from a list of ESPN API competitor data.
+
+        All rows, including their nested teams, are validated in a single pass.
+
+        Args:
+            rows: Raw competitor data items from ESPN API
+            event: Event these competitors are in
+            league: League for team lookup
+
+        Returns:
+            List of Competitor instances
+        """
+        normalized = [cls._normalize(row, event, league) for row in rows]
+        return model_list_adapter(cls).validate_python(normalized)
+
+    @classmethod
+    def from_espn_data(cls, data: Dict[str, Any], event: Event, league: League) -> "Competitor":
         """Create Competitor instance from ESPN API data.
 
         Args:
@@ -200,34 +309,9 @@ class Competitor(ESPNModel):
         Returns:
             Competitor instance
         """
-        team_data = data.get("team", {})
+        return cls.from_espn_data_many([data], event, league)[0]
+
 
-        # Create team if we don't have it
-        team = Team.from_espn_data({"team": team_data}, league)
-
-        # Convert records and statistics
-        records = []
-        if data.get("records"):
-            for record_data in data["records"]:
-                if isinstance(record_data, dict):
-                    records.append(Record(**record_data))
-
-        statistics = []
-        if data.get("statistics"):
-            for stat_data in data["statistics"]:
-                if isinstance(stat_data, dict):
-                    statistics.append(Statistic(**stat_data))
-
-        return cls(
-            event=event,
-            team=team,
-            home_away=data.get("homeAway", "away"),
-            score=data.get("score", ""),
-            winner=data.get("winner"),
-            line_scores=data.get("linescores", []),
-            records=records,
-            statistics=statistics,
-            leaders=data.get("leaders", []),
-            order=data.get("order", 0),
-            raw_data=data,
-        )
\ No newline at end of file
+# Build batch validators at import instead of on the first parsed response
+model_list_adapter(Event)
+model_list_adapter(Competitor)
@@ -1,8 +1,10 @@
 """Sport and League models for espnapi."""
 
-from typing import Optional
+import sys
+from types import MappingProxyType
+from typing import ClassVar, Mapping, Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, Field
 
 from espnapi.models.base import ESPNModel
 
@@ -11,8 +13,13 @@ class Sport(ESPNModel):
     """Sport entity (e.g., basketball, football).
 
     Represents a sport category that contains multiple leagues.
+    Instances are immutable so the predefined ones can be shared freely.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    raw_data: ClassVar[None] = None  # type: ignore[misc]
+
     slug: str = Field(..., description="URL-friendly identifier (e.g., 'basketball')")
     name: str = Field(..., description="Display name (e.g., 'Basketball')")
 
@@ -20,13 +27,34 @@ class Sport(ESPNModel):
         """String representation."""
         return self.name
 
+    def __hash__(self) -> int:
+        """Hash by slug, which identifies a sport."""
+        return hash(self.slug)
+
+    @classmethod
+    def get(cls, slug: str) -> Optional["Sport"]:
+        """Get the predefined Sport for a slug.
+
+        Args:
+            slug: Sport slug (e.g., "basketball")
+
+        Returns:
+            Shared Sport instance, or None if the slug is not predefined
+        """
+        return SPORTS.get(slug)
+
 
 class League(ESPNModel):
     """League entity (e.g., NBA, NFL).
 
     Represents a specific league within a sport.
+    Instances are immutable so the predefined ones can be shared freely.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
+    raw_data: ClassVar[None] = None  # type: ignore[misc]
+
     sport: Sport = Field(..., description="Parent sport")
     slug: str = Field(..., description="URL-friendly identifier (e.g., 'nba')")
     name: str = Field(..., description="Display name (e.g., 'NBA')")
@@ -37,6 +65,10 @@ class League(ESPNModel):
         sport_name = self.sport.name if isinstance(self.sport, Sport) else str(self.sport)
         return f"{self.name} ({sport_name})"
 
+    def __hash__(self) -> int:
+        """Hash by slug, which identifies a league."""
+        return hash(self.slug)
+
     @property
     def sport_slug(self) -> str:
         """Get sport slug from sport object or string."""
@@ -44,9 +76,21 @@ class League(ESPNModel):
             return self.sport.slug
         return str(self.sport)
 
+    @classmethod
+    def get(cls, slug: str) -> Optional["League"]:
+        """Get the predefined League for a slug.
+
+        Args:
+            slug: League slug (e.g., "nba")
+
+        Returns:
+            Shared League instance, or None if the slug is not predefined
+        """
+        return LEAGUES.get(slug)
+
 
 # Predefined sports for convenience
-SPORTS = {
+_SPORTS = {
     "basketball": Sport(slug="basketball", name="Basketball"),
     "football": Sport(slug="football", name="Football"),
     "baseball": Sport(slug="baseball", name="Baseball"),
@@ -58,21 +102,26 @@ SPORTS = {
     "racing": Sport(slug="racing", name="Racing"),
 }
 
+# Read-only views keyed by interned slugs
+SPORTS: Mapping[str, Sport] = MappingProxyType({sys.intern(k): v for k, v in _SPORTS.items()})
+
 # Predefined leagues for convenience
-LEAGUES = {
-    "nba": League(sport=SPORTS["basketball"], slug="nba", name="NBA", abbreviation="NBA"),
-    "wnba": League(sport=SPORTS["basketball"], slug="wnba", name="WNBA", abbreviation="WNBA"),
-    "nfl": League(sport=SPORTS["football"], slug="nfl", name="NFL", abbreviation="NFL"),
-    "mlb": League(sport=SPORTS["baseball"], slug="mlb", name="MLB", abbreviation="MLB"),
-    "nhl": League(sport=SPORTS["hockey"], slug="nhl", name="NHL", abbreviation="NHL"),
-    "mls": League(sport=SPORTS["soccer"], slug="mls", name="MLS", abbreviation="MLS"),
+_LEAGUES = {
+    "nba": League(sport=_SPORTS["basketball"], slug="nba", name="NBA", abbreviation="NBA"),
+    "wnba": League(sport=_SPORTS["basketball"], slug="wnba", name="WNBA", abbreviation="WNBA"),
+    "nfl": League(sport=_SPORTS["football"], slug="nfl", name="NFL", abbreviation="NFL"),
+    "mlb": League(sport=_SPORTS["baseball"], slug="mlb", name="MLB", abbreviation="MLB"),
+    "nhl": League(sport=_SPORTS["hockey"], slug="nhl", name="NHL", abbreviation="NHL"),
+    "mls": League(sport=_SPORTS["soccer"], slug="mls", name="MLS", abbreviation="MLS"),
     "college-football": League(
-        sport=SPORTS["football"], slug="college-football", name="College Football", abbreviation="NCAAF"
+        sport=_SPORTS["football"], slug="college-football", name="College Football", abbreviation="NCAAF"
     ),
     "mens-college-basketball": League(
-        sport=SPORTS["basketball"],
+        sport=_SPORTS["basketball"],
         slug="mens-college-basketball",
         name="Men's College Basketball",
         abbreviation="NCAAM",
     ),
-}
\ No newline at end of file
+}
+
+LEAGUES: Mapping[str, League] = MappingProxyType({sys.intern(k): v for k, v in _LEAGUES.items()})
@@ -1,12 +1,29 @@
 """Team model for espnapi."""
 
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
-from espnapi.models.base import ESPNModel, Link, Logo
+from espnapi.models.base import ESPNModel, Link, Logo, map_fields, model_list_adapter
 from espnapi.models.sport import League
 
+# ESPN team keys copied verbatim onto Team fields
+_TEAM_FIELD_MAP = {
+    "uid": "uid",
+    "slug": "slug",
+    "abbreviation": "abbreviation",
+    "displayName": "display_name",
+    "shortDisplayName": "short_display_name",
+    "name": "name",
+    "nickname": "nickname",
+    "location": "location",
+    "color": "color",
+    "alternateColor": "alternate_color",
+    "isActive": "is_active",
+    "isAllStar": "is_all_star",
+}
+_TEAM_DEFAULTS = {"abbreviation": "", "display_name": ""}
+
 
 class Team(ESPNModel):
     """Team entity representing a sports team.
@@ -51,19 +68,16 @@ class Team(ESPNModel):
     def primary_logo(self) -> Optional[str]:
         """Get the primary logo URL.
 
+        The "default" logo is preferred, falling back to the first logo.
+
         Returns:
             URL of the primary logo, or None if no logos available
         """
-        if not self.logos:
-            return None
-
-        # Look for default logo first
-        for logo in self.logos:
-            if "default" in logo.rel:
-                return logo.href
-
-        # Fallback to first logo
-        return self.logos[0].href if self.logos else None
+        logos = self.logos
+        return next(
+            (logo.href for logo in logos if "default" in logo.rel),
+            logos[0].href if logos else None,
+        )
 
     @property
     def logo_url(self) -> Optional[str]:
@@ -84,8 +98,38 @@ class Team(ESPNModel):
         """Get the full team name."""
         return self.display_name
 
+    @staticmethod
+    def _normalize(data: Dict[str, Any], league: League) -> Dict[str, Any]:
+        """Map raw ESPN team data onto Team field names."""
+        # Extract nested team data if present
+        team_data = data.get("team", data)
+
+        fields = map_fields(team_data, _TEAM_FIELD_MAP, _TEAM_DEFAULTS)
+        fields["league"] = league
+        fields["espn_id"] = str(team_data.get("id", ""))
+        fields["logos"] = [logo for logo in team_data.get("logos") or () if isinstance(logo, dict)]
+        fields["links"] = [link for link in team_data.get("links") or () if isinstance(link, dict)]
+        fields["raw_data"] = team_data
+        return fields
+
+    @classmethod
+    def from_espn_data_many(cls, rows: List[Dict[str, Any]], league: League) -> List["Team"]:
+        """Create Team instances from a list of ESPN API team data.
+
+        All rows are validated in a single pass.
+
+        Args:
+            rows: Raw team data items from ESPN API
+            league: League these teams belong to
+
+        Returns:
+            List of Team instances
+        """
+        normalized = [cls._normalize(row, league) for row in rows]
+        return model_list_adapter(cls).validate_python(normalized)
+
     @classmethod
-    def from_espn_data(cls, data: dict, league: League) -> "Team":
+    def from_espn_data(cls, data: Dict[str, Any], league: League) -> "Team":
         """Create Team instance from ESPN API data.
 
         Args:
@@ -95,38 +139,8 @@ class Team(ESPNModel):
         Returns:
             Team instance
         """
-        # Extract nested team data if present
-        team_data = data.get("team", data)
+        return cls.from_espn_data_many([data], league)[0]
+
 
-        # Convert logos and links
-        logos = []
-        if team_data.get("logos"):
-            for logo_data in team_data["logos"]:
-                if isinstance(logo_data, dict):
-                    logos.append(Logo(**logo_data))
-
-        links = []
-        if team_data.get("links"):
-            for link_data in team_data["links"]:
-                if isinstance(link_data, dict):
-                    links.append(Link(**link_data))
-
-        return cls(
-            league=league,
-            espn_id=str(team_data.get("id", "")),
-            uid=team_data.get("uid"),
-            slug=team_data.get("slug"),
-            abbreviation=team_data.get("abbreviation", ""),
-            display_name=team_data.get("displayName", ""),
-            short_display_name=team_data.get("shortDisplayName"),
-            name=team_data.get("name"),
-            nickname=team_data.get("nickname"),
-            location=team_data.get("location"),
-            color=team_data.get("color"),
-            alternate_color=team_data.get("alternateColor"),
-            is_active=team_data.get("isActive", True),
-            is_all_star=team_data.get("isAllStar", False),
-            logos=logos,
-            links=links,
-            raw_data=team_data,
-        )
\ No newline at end of file
+# Build batch validators at import instead of on the first parsed response
+model_list_adapter(Team)
@@ -1,10 +1,14 @@
 """Venue model for espnapi."""
 
-from typing import Optional
+from typing import Any, Dict, List, Optional
 
 from pydantic import Field
 
-from espnapi.models.base import ESPNModel, Address
+from espnapi.models.base import ESPNModel, Address, map_fields, model_list_adapter
+
+# ESPN venue keys copied verbatim onto Venue fields
+_VENUE_FIELD_MAP = {"indoor": "is_indoor", "capacity": "capacity"}
+_VENUE_DEFAULTS: Dict[str, Any] = {}
 
 
 class Venue(ESPNModel):
@@ -25,31 +29,55 @@ class Venue(ESPNModel):
 
     def __str__(self) -> str:
         """String representation."""
-        location_parts = [self.city, self.state]
-        location = ", ".join(filter(None, location_parts))
+        location = ", ".join(p for p in (self.city, self.state) if p)
         return f"{self.name} ({location})" if location else self.name
 
     @property
     def location(self) -> str:
         """Get formatted location string."""
-        parts = [self.city, self.state, self.country]
-        return ", ".join(filter(None, parts))
+        return ", ".join(p for p in (self.city, self.state, self.country) if p)
 
     @property
     def full_address(self) -> str:
         """Get complete address if available."""
-        if self.address:
-            parts = [
-                self.address.city,
-                self.address.state,
-                self.address.zip_code,
-                self.address.country,
-            ]
-            return ", ".join(filter(None, parts))
+        address = self.address
+        if address:
+            parts = (address.city, address.state, address.zip_code, address.country)
+            return ", ".join(p for p in parts if p)
         return self.location
 
+    @staticmethod
+    def _normalize(data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map raw ESPN venue data onto Venue field names."""
+        address_data = data.get("address", {})
+
+        fields = map_fields(data, _VENUE_FIELD_MAP, _VENUE_DEFAULTS)
+        fields["espn_id"] = str(data.get("id", ""))
+        fields["name"] = data.get("fullName", data.get("shortName", ""))
+        fields["city"] = address_data.get("city")
+        fields["state"] = address_data.get("state")
+        fields["country"] = address_data.get("country", "USA")
+        fields["address"] = address_data or None
+        fields["raw_data"] = data
+        return fields
+
+    @classmethod
+    def from_espn_data_many(cls, rows: List[Dict[str, Any]]) -> List["Venue"]:
+        """Create Venue instances from a list of ESPN API venue data.
+
+        All rows are validated in a single pass.
+
+        Args:
+            rows: Raw venue data items from ESPN API
+
+        Returns:
+            List of Venue instances
+        """
+        normalized = [cls._normalize(row) for row in rows]
+        return model_list_adapter(cls).validate_python(normalized)
+
     @classmethod
-    def from_espn_data(cls, data: dict) -> "Venue":
+    def from_espn_data(cls, data: Dict[str, Any]) -> "Venue":
         """Create Venue instance from ESPN API data.
 
         Args:
@@ -58,16 +86,8 @@ class Venue(ESPNModel):
         Returns:
             Venue instance
         """
-        address_data = data.get("address", {})
+        return cls.from_espn_data_many([data])[0]
+
 
-        return cls(
-            espn_id=str(data.get("id", "")),
-            name=data.get("fullName", data.get("shortName", "")),
-            city=address_data.get("city"),
-            state=address_data.get("state"),
-            country=address_data.get("country", "USA"),
-            is_indoor=data.get("indoor", True),
-            capacity=data.get("capacity"),
-            address=Address(**address_data) if address_data else None,
-            raw_data=data,
-        )
\ No newline at end of file
+# Build batch validators at import instead of on the first parsed response
+model_list_adapter(Venue)
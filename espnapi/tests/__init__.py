@@ -1 +0,0 @@
-"""Tests for espnapi package."""
\ No newline at end of file
@@ -1,7 +1,39 @@
 """Utility functions for espnapi."""
 
-from datetime import datetime
-from typing import Any
+import asyncio
+import json
+import sys
+from datetime import date, datetime
+from functools import lru_cache
+from numbers import Real
+from typing import TYPE_CHECKING, Any, Callable, Iterator, Sequence
+
+if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - optional dependency
+    ciso8601 = None  # type: ignore[assignment,unused-ignore]
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - optional dependency
+    np = None  # type: ignore[assignment,unused-ignore]
+
+# ISO-8601 parser; ciso8601 when installed, otherwise fromisoformat, which
+# accepts ESPN's trailing "Z" natively on Python 3.11+
+_parse_iso_datetime: Callable[[str], datetime] = (
+    ciso8601.parse_datetime if ciso8601 is not None else datetime.fromisoformat
+)
+
+# JSON decoder for raw response bodies; orjson when installed, stdlib otherwise
+json_loads: Callable[[bytes | str], Any] = orjson.loads if orjson is not None else json.loads
 
 
 def parse_datetime(date_str: str) -> datetime:
@@ -15,12 +47,32 @@ def parse_datetime(date_str: str) -> datetime:
     """
     try:
         # ESPN uses ISO format with 'Z' suffix sometimes
-        return datetime.fromisoformat(date_str.replace("Z", "+00:00"))
+        return _parse_iso_datetime(date_str)
     except (ValueError, TypeError):
         # Fallback to current time if parsing fails
         return datetime.now()
 
 
+@lru_cache(maxsize=64)
+def _format_ordinal_date(ordinal: int) -> str:
+    return date.fromordinal(ordinal).strftime("%Y%m%d")
+
+
+def format_espn_date(value: date) -> str:
+    """Format a date/datetime as ESPN's YYYYMMDD query value.
+
+    Results are memoized per calendar day, so repeated polling for the same
+    day skips strftime.
+
+    Args:
+        value: Date or datetime to format
+
+    Returns:
+        Date string in YYYYMMDD format
+    """
+    return _format_ordinal_date(value.toordinal())
+
+
 def safe_int(value: Any, default: int = 0) -> int:
     """Safely convert value to int.
 
@@ -33,7 +85,7 @@ def safe_int(value: Any, default: int = 0) -> int:
     """
     try:
         return int(value)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return default
 
 
@@ -49,10 +101,51 @@ def safe_float(value: Any, default: float = 0.0) -> float:
     """
     try:
         return float(value)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, OverflowError):
         return default
 
 
+def _iter_floats(values: Sequence[Any], default: float) -> Iterator[float]:
+    for value in values:
+        try:
+            yield float(value)
+        except (ValueError, TypeError, OverflowError):
+            yield default
+
+
+def safe_float_list(values: Sequence[Any], default: float = 0.0) -> list[float]:
+    """Safely convert a sequence of values to a list of floats.
+
+    Args:
+        values: Values to convert
+        default: Default for each value that fails conversion
+
+    Returns:
+        List of floats
+    """
+    return list(_iter_floats(values, default))
+
+
+def safe_float_array(values: Sequence[Any], default: float = 0.0) -> "NDArray[np.float64]":
+    """Safely convert a sequence of values to a float64 numpy array in one call.
+
+    Requires the optional numpy extra.
+
+    Args:
+        values: Values to convert
+        default: Default for each value that fails conversion
+
+    Returns:
+        float64 numpy array
+
+    Raises:
+        ImportError: If numpy is not installed
+    """
+    if np is None:
+        raise ImportError("safe_float_array requires numpy; install espnapi[numpy]")
+    return np.fromiter(_iter_floats(values, default), dtype=np.float64, count=len(values))
+
+
 def safe_str(value: Any, default: str = "") -> str:
     """Safely convert value to string.
 
@@ -68,6 +161,9 @@ def safe_str(value: Any, default: str = "") -> str:
     return str(value)
 
 
+_TRUTHY: frozenset[str] = frozenset({"true", "1", "yes", "on", "t", "y"})
+
+
 def safe_bool(value: Any, default: bool = False) -> bool:
     """Safely convert value to boolean.
 
@@ -78,11 +174,13 @@ def safe_bool(value: Any, default: bool = False) -> bool:
     Returns:
         Boolean value or default
     """
-    if isinstance(value, bool):
+    if type(value) is bool:
         return value
     if isinstance(value, str):
-        return value.lower() in ("true", "1", "yes", "on")
-    if isinstance(value, (int, float)):
+        return value.lower() in _TRUTHY
+    if isinstance(value, Real):
+        return bool(value)
+    if np is not None and isinstance(value, np.bool_):
         return bool(value)
     return default
 
@@ -104,4 +202,69 @@ def extract_nested_value(data: dict[str, Any], keys: list[str], default: Any = N
             current = current[key]
         else:
             return default
-    return current
\ No newline at end of file
+    return current
+
+
+_EMPTY: dict[str, Any] = {}
+
+
+def path(*keys: str | int, default: Any = None) -> Callable[[Any], Any]:
+    """Compile an accessor for a fixed nested path of keys and list indexes.
+
+    The lookup chain is generated once, so each call is a handful of
+    ``dict.get`` calls and subscripts instead of a loop over the keys.
+    String keys look up dictionaries and integer keys index sequences;
+    missing keys, out-of-range indexes and mismatched intermediate values
+    yield the default.
+
+    Args:
+        *keys: Dictionary keys or sequence indexes to traverse, outermost first
+        default: Default value if path doesn't exist
+
+    Returns:
+        Function taking a dictionary and returning the value at the path
+    """
+    if not keys:
+        raise ValueError("path requires at least one key")
+    if not all(type(key) is str or type(key) is int for key in keys):
+        raise TypeError("path keys must be strings or integers")
+
+    lookups = [f".get({key!r}, _EMPTY)" if type(key) is str else f"[{key!r}]" for key in keys[:-1]]
+    last = keys[-1]
+    lookups.append(f".get({last!r}, default)" if type(last) is str else f"[{last!r}]")
+    source = (
+        "def _get(data):\n"
+        "    try:\n"
+        f"        return data{''.join(lookups)}\n"
+        "    except (AttributeError, LookupError, TypeError):\n"
+        "        return default\n"
+    )
+    namespace: dict[str, Any] = {"_EMPTY": _EMPTY, "default": default}
+    exec(source, namespace)
+    accessor: Callable[[Any], Any] = namespace["_get"]
+    return accessor
+
+
+def install_uvloop() -> bool:
+    """Use uvloop as the asyncio event loop policy when it is available.
+
+    Skipped on Windows, when uvloop is not installed, or when called from
+    inside a running event loop.
+
+    Returns:
+        True if the uvloop policy was installed
+    """
+    if sys.platform == "win32":
+        return False
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        pass
+    else:
+        return False
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
@@ -1,16 +1,22 @@
 import asyncio
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
 
 from espnapi import AsyncESPNClient
 
+LEAGUES = [
+    ("football", "nfl"),
+    ("basketball", "nba"),
+    ("hockey", "nhl"),
+]
+
 
-async def main() -> None:
+async def main(pairs: list[tuple[str, str]] = LEAGUES) -> None:
     async with AsyncESPNClient() as client:
-        response = await client.get_teams("football", "nfl", limit=5)
-        print(response.data.get("sports", []))
+        # One pooled connection serves every league, so the requests overlap
+        responses = await asyncio.gather(
+            *(client.get_teams(sport, league, limit=5) for sport, league in pairs)
+        )
+        for (sport, league), response in zip(pairs, responses, strict=True):
+            print(sport, league, response.data.get("sports", []))
 
 
 if __name__ == "__main__":
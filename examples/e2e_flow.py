@@ -1,23 +1,22 @@
-import sys
-from pathlib import Path
+import asyncio
 
-sys.path.append(str(Path(__file__).resolve().parents[1]))
+from espnapi import AsyncESPNClient
 
-from espnapi import ESPNClient
 
-
-def main() -> None:
-    with ESPNClient() as client:
-        scoreboard = client.get_scoreboard("basketball", "nba", limit=1)
-        events = scoreboard.data.get("events", [])
+async def main() -> None:
+    async with AsyncESPNClient() as client:
+        scoreboard = await client.get_scoreboard("basketball", "nba", limit=3)
+        events = scoreboard.events
         if not events:
             print("No events found.")
             return
 
-        event_id = events[0]["id"]
-        detail = client.get_event("basketball", "nba", event_id)
-        print(detail.data.get("boxscore", {}).get("id"))
+        details = await asyncio.gather(
+            *(client.get_event("basketball", "nba", event["id"]) for event in events)
+        )
+        for detail in details:
+            print(detail.data.get("boxscore", {}).get("id"))
 
 
 if __name__ == "__main__":
-    main()
+    asyncio.run(main())
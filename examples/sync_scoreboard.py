@@ -1,17 +1,13 @@
-import sys
-from pathlib import Path
-
-sys.path.append(str(Path(__file__).resolve().parents[1]))
-
-from espnapi import ESPNClient, ESPNClientError
+from espnapi import ESPNClientError
+from espnapi.client.sync import get_espn_client
 
 
 def main() -> None:
+    # The shared client keeps its connections open across calls and closes at exit
+    client = get_espn_client()
     try:
-        with ESPNClient() as client:
-            response = client.get_scoreboard("basketball", "nba")
-            events = response.data.get("events", [])
-            print(events)
+        response = client.get_scoreboard("basketball", "nba")
+        print(response.events)
     except ESPNClientError as exc:
         print(f"ESPN error: {exc}")
 
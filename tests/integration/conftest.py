@@ -1,17 +1,94 @@
 """Integration test fixtures."""
 
+import asyncio
+from pathlib import Path
+
 import pytest
+import pytest_asyncio
+import vcr
+
+from espnapi.client import AsyncESPNClient, ESPNClient
+from espnapi.config import ESPNConfig
+from espnapi.utils import path
+
+# Connection pool size for the async client; concurrent tests stay within it
+_POOL_SIZE = 8
+
+# Session-level recordings; per-test cassettes live in per-module subdirectories
+_CASSETTE_DIR = Path(__file__).parent / "cassettes"
+
+_FIRST_TEAM_ID = path("sports", 0, "leagues", 0, "teams", 0, "team", "id")
+
+
+def _vcr_settings(config: pytest.Config) -> dict:
+    """Cassette settings shared by the vcr marker and session-level recordings."""
+    return {
+        # An explicit --record-mode wins; otherwise record only missing cassettes
+        "record_mode": config.getoption("--record-mode") or "once",
+        "filter_headers": ["authorization", "cookie", "set-cookie"],
+        "decode_compressed_response": True,
+    }
+
+
+@pytest.fixture(scope="module")
+def vcr_config(pytestconfig):
+    """Record ESPN responses into cassettes, replaying any cassette that already exists.
+
+    No cassettes are committed yet, so the first run calls the live API. Refresh
+    cassettes with --record-mode=rewrite, or skip recording with --disable-recording.
+    """
+    return _vcr_settings(pytestconfig)
 
 
 @pytest.fixture(scope="session")
 def real_client():
-    """Real ESPN client for integration tests."""
-    from espnapi.client import ESPNClient
-    return ESPNClient()
+    """Real ESPN client for integration tests, opened once per session."""
+    with ESPNClient() as client:
+        yield client
+
+
+@pytest.fixture(scope="session")
+def sample_nba_team_id(pytestconfig, real_client):
+    """ID of the first NBA team, looked up once per session."""
+    if pytestconfig.getoption("--disable-recording"):
+        response = real_client.get_teams("basketball", "nba", limit=1)
+    else:
+        # Session fixtures run outside the per-test cassettes, so record separately
+        settings = _vcr_settings(pytestconfig)
+        if settings["record_mode"] == "rewrite":
+            settings["record_mode"] = "all"
+        recorder = vcr.VCR(cassette_library_dir=str(_CASSETTE_DIR), **settings)
+        with recorder.use_cassette("sample_nba_team_id.yaml"):
+            response = real_client.get_teams("basketball", "nba", limit=1)
+    team_id = _FIRST_TEAM_ID(response.data)
+    assert team_id is not None, "Expected at least one NBA team"
+    return team_id
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def real_async_client():
+    """Real async ESPN client for integration tests, opened once per session.
+
+    The underlying httpx.AsyncClient is bound to the session event loop, so
+    tests using it must run with loop_scope="session".
+    """
+    config = ESPNConfig(pool_max=_POOL_SIZE, pool_keepalive=_POOL_SIZE)
+    async with AsyncESPNClient(config) as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session", autouse=True)
+async def _warm_async_pool(request, real_async_client):
+    """Open a live connection before the first test so it does not pay the handshake.
+
+    Cassette replays never touch the network, so this only runs with
+    --disable-recording.
+    """
+    if request.config.getoption("disable_recording", default=False):
+        await real_async_client.get_teams("basketball", "nba", limit=1)
 
 
 @pytest.fixture(scope="session")
-def real_async_client():
-    """Real async ESPN client for integration tests."""
-    from espnapi.client.async_client import AsyncESPNClient
-    return AsyncESPNClient()
\ No newline at end of file
+def request_slots():
+    """Semaphore bounding concurrent requests to the async client's pool size."""
+    return asyncio.Semaphore(_POOL_SIZE)
@@ -0,0 +1,79 @@
+"""Unit tests for the response cache."""
+
+import json
+from unittest.mock import MagicMock, patch
+
+from espnapi.client import cache as cache_module
+from espnapi.client.base import ESPNResponse
+from espnapi.client.cache import ResponseCache
+from espnapi.client.sync import ESPNClient
+from espnapi.config import ESPNConfig
+
+
+def _response(url: str = "u") -> ESPNResponse:
+    return ESPNResponse(data={}, status_code=200, url=url)
+
+
+class TestResponseCache:
+    """Test ResponseCache behavior."""
+
+    def test_get_set(self):
+        """Stored responses are returned until they expire."""
+        cache = ResponseCache(ttl=10.0)
+        response = _response()
+        cache.set("k", response)
+        assert cache.get("k") is response
+        assert cache.get("missing") is None
+
+    def test_expiry(self, monkeypatch):
+        """Expired entries are dropped."""
+        now = {"t": 100.0}
+        monkeypatch.setattr(cache_module.time, "monotonic", lambda: now["t"])
+        cache = ResponseCache(ttl=5.0)
+        cache.set("k", _response())
+
+        now["t"] = 105.0
+        assert cache.get("k") is None
+        assert len(cache) == 0
+
+    def test_lru_eviction(self):
+        """Least recently used entries are evicted first."""
+        cache = ResponseCache(ttl=10.0, maxsize=2)
+        cache.set("a", _response("a"))
+        cache.set("b", _response("b"))
+        cache.get("a")
+        cache.set("c", _response("c"))
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+        cache.clear()
+        assert len(cache) == 0
+
+
+class TestClientCaching:
+    """Test client-level caching."""
+
+    def test_disabled_by_default(self):
+        """No cache is created unless cache_ttl is set."""
+        assert ESPNClient()._cache is None
+
+    @patch("httpx.Client")
+    def test_get_uses_cache(self, mock_client_class):
+        """Repeated GETs with the same params hit the network once."""
+        mock_client_instance = MagicMock()
+        mock_client_class.return_value = mock_client_instance
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.content = json.dumps({"teams": []}).encode()
+        mock_client_instance.request.return_value = mock_response
+
+        client = ESPNClient(ESPNConfig(cache_ttl=60.0))
+        first = client.get_teams("basketball", "nba")
+        second = client.get_teams("basketball", "nba")
+        client.get_teams("basketball", "nba", limit=5)
+
+        assert first is second
+        assert mock_client_instance.request.call_count == 2
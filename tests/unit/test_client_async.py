@@ -1,40 +1,32 @@
 """Unit tests for asynchronous ESPN client."""
 
+import asyncio
+import json
+from datetime import datetime
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from espnapi.client import async_client
 from espnapi.client.async_client import AsyncESPNClient
-from espnapi.client.base import ESPNEndpointDomain
-from espnapi.config import ESPNConfig
+from espnapi.client.base import ESPNEndpointDomain, ESPNResponse, ScoreboardResponse
 from espnapi.exceptions import ESPNClientError, ESPNNotFoundError, ESPNRateLimitError
 
 
 class TestAsyncESPNClient:
     """Test cases for asynchronous ESPN client."""
 
-    @pytest.fixture
-    def config(self):
-        """Test configuration."""
-        return ESPNConfig(
-            site_api_base_url="https://test.api.espn.com",
-            core_api_base_url="https://test.core.api.espn.com",
-            timeout=10.0,
-            max_retries=2,
-        )
-
     @pytest.fixture
     def client(self, config):
         """Test client instance."""
         return AsyncESPNClient(config)
 
-    @pytest.mark.asyncio
     async def test_initialization(self, config):
         """Test client initialization."""
         client = AsyncESPNClient(config)
         assert client.config == config
         assert client._client is None  # Lazy initialization
 
-    @pytest.mark.asyncio
     async def test_context_manager(self, client):
         """Test context manager usage."""
         async with client as c:
@@ -43,7 +35,6 @@ class TestAsyncESPNClient:
         assert client._client is None  # Should be closed
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_client_property_lazy_init(self, mock_client_class, client):
         """Test lazy initialization of async HTTP client."""
         mock_client_instance = AsyncMock()
@@ -57,7 +48,6 @@ class TestAsyncESPNClient:
         assert http_client == mock_client_instance
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_client_property_reuse(self, mock_client_class, client):
         """Test that client property reuses existing client."""
         mock_client_instance = AsyncMock()
@@ -72,7 +62,6 @@ class TestAsyncESPNClient:
         mock_client_class.assert_called_once()
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_client_property_recreate_after_close(self, mock_client_class, client):
         """Test client recreation after close."""
         mock_client_instance1 = AsyncMock()
@@ -92,76 +81,56 @@ class TestAsyncESPNClient:
         assert client._client == mock_client_instance2
         assert mock_client_class.call_count == 2
 
-    def test_build_url_site_domain(self, client):
-        """Test URL building for site domain."""
-        url = client._build_url(ESPNEndpointDomain.SITE, "test/path")
-        assert url == "https://test.api.espn.com/test/path"
-
-    def test_build_url_core_domain(self, client):
-        """Test URL building for core domain."""
-        url = client._build_url(ESPNEndpointDomain.CORE, "test/path")
-        assert url == "https://test.core.api.espn.com/test/path"
-
-    def test_build_url_with_leading_slash(self, client):
-        """Test URL building handles leading slashes."""
-        url = client._build_url(ESPNEndpointDomain.SITE, "/test/path")
-        assert url == "https://test.api.espn.com/test/path"
-
-    def test_handle_response_success(self, client):
+    @pytest.mark.parametrize(
+        "domain,path,expected",
+        [
+            (ESPNEndpointDomain.SITE, "a/b", "https://test.api.espn.com/a/b"),
+            (ESPNEndpointDomain.SITE, "/a/b", "https://test.api.espn.com/a/b"),
+            (ESPNEndpointDomain.SITE, "//a/b", "https://test.api.espn.com/a/b"),
+            (ESPNEndpointDomain.CORE, "/x", "https://test.core.api.espn.com/x"),
+        ],
+    )
+    def test_build_url(self, client, domain, path, expected):
+        """Test URL building with and without leading slashes."""
+        url = client._build_url(domain, path)
+        assert url == expected
+        assert "//" not in url.removeprefix("https://")
+
+    def test_handle_response_success(self, client, mock_async_response):
         """Test successful response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
-
-        result = client._handle_response(mock_response, "test_url")
+        result = client._handle_response(mock_async_response, "test_url")
 
         assert result.status_code == 200
         assert result.data == {"test": "data"}
         assert result.url == "test_url"
 
-    def test_handle_response_404_error(self, client):
-        """Test 404 response handling."""
+    @pytest.mark.parametrize(
+        "status,exc,match",
+        [
+            (404, ESPNNotFoundError, "ESPN resource not found"),
+            (429, ESPNRateLimitError, "ESPN API rate limit exceeded"),
+            (500, ESPNClientError, "ESPN server error: 500"),
+            (400, ESPNClientError, "ESPN API error: 400"),
+        ],
+    )
+    def test_handle_response_errors(self, client, status, exc, match):
+        """Test error status codes raise the matching exception."""
         mock_response = MagicMock()
-        mock_response.status_code = 404
+        mock_response.status_code = status
 
-        with pytest.raises(ESPNNotFoundError, match="ESPN resource not found"):
-            client._handle_response(mock_response, "test_url")
-
-    def test_handle_response_429_error(self, client):
-        """Test 429 response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-
-        with pytest.raises(ESPNRateLimitError, match="ESPN API rate limit exceeded"):
-            client._handle_response(mock_response, "test_url")
-
-    def test_handle_response_500_error(self, client):
-        """Test 500 response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-
-        with pytest.raises(ESPNClientError, match="ESPN server error: 500"):
-            client._handle_response(mock_response, "test_url")
-
-    def test_handle_response_400_error(self, client):
-        """Test 400 response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-
-        with pytest.raises(ESPNClientError, match="ESPN API error: 400"):
+        with pytest.raises(exc, match=match):
             client._handle_response(mock_response, "test_url")
 
     def test_handle_response_json_error(self, client):
         """Test JSON parsing error handling."""
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
+        mock_response.content = b"not json"
 
         with pytest.raises(ESPNClientError, match="Failed to parse ESPN response"):
             client._handle_response(mock_response, "test_url")
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_method(self, mock_client_class, client):
         """Test GET method."""
         mock_client_instance = AsyncMock()
@@ -169,19 +138,18 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "test"}
+        mock_response.content = json.dumps({"data": "test"}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get("test/path", params={"key": "value"})
 
         mock_client_instance.request.assert_called_once_with(
-            "GET", "https://test.api.espn.com/test/path", params={"key": "value"}
+            "GET", "https://test.api.espn.com/test/path?key=value"
         )
         assert result.data == {"data": "test"}
         assert result.status_code == 200
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_scoreboard(self, mock_client_class, client):
         """Test get_scoreboard method."""
         mock_client_instance = AsyncMock()
@@ -189,29 +157,28 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"events": []}
+        mock_response.content = json.dumps({"events": []}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get_scoreboard("basketball", "nba", date="20241215", limit=10)
 
         expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
         mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"dates": "20241215", "limit": 10}
+            "GET", f"{expected_url}?dates=20241215&limit=10"
         )
         assert result.data == {"events": []}
+        assert isinstance(result, ScoreboardResponse)
+        assert result.first_event_id is None
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_scoreboard_datetime(self, mock_client_class, client):
         """Test get_scoreboard with datetime object."""
-        from datetime import datetime
-
         mock_client_instance = AsyncMock()
         mock_client_class.return_value = mock_client_instance
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"events": []}
+        mock_response.content = json.dumps({"events": []}).encode()
         mock_client_instance.request.return_value = mock_response
 
         test_date = datetime(2024, 12, 15)
@@ -219,11 +186,10 @@ class TestAsyncESPNClient:
 
         expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
         mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"dates": "20241215"}
+            "GET", f"{expected_url}?dates=20241215"
         )
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_teams(self, mock_client_class, client):
         """Test get_teams method."""
         mock_client_instance = AsyncMock()
@@ -231,19 +197,18 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"teams": []}
+        mock_response.content = json.dumps({"teams": []}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get_teams("basketball", "nba", limit=50)
 
         expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/teams"
         mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"limit": 50}
+            "GET", f"{expected_url}?limit=50"
         )
         assert result.data == {"teams": []}
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_team(self, mock_client_class, client):
         """Test get_team method."""
         mock_client_instance = AsyncMock()
@@ -251,17 +216,16 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"team": {"id": "1"}}
+        mock_response.content = json.dumps({"team": {"id": "1"}}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get_team("basketball", "nba", "1")
 
         expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/teams/1"
-        mock_client_instance.request.assert_called_once_with("GET", expected_url, params=None)
+        mock_client_instance.request.assert_called_once_with("GET", expected_url)
         assert result.data == {"team": {"id": "1"}}
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_event(self, mock_client_class, client):
         """Test get_event method."""
         mock_client_instance = AsyncMock()
@@ -269,19 +233,18 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"event": {"id": "123"}}
+        mock_response.content = json.dumps({"event": {"id": "123"}}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get_event("basketball", "nba", "123")
 
         expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/summary"
         mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"event": "123"}
+            "GET", f"{expected_url}?event=123"
         )
         assert result.data == {"event": {"id": "123"}}
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_league_info(self, mock_client_class, client):
         """Test get_league_info method."""
         mock_client_instance = AsyncMock()
@@ -289,17 +252,16 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"league": {"id": "nba"}}
+        mock_response.content = json.dumps({"league": {"id": "nba"}}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get_league_info("basketball", "nba")
 
         expected_url = "https://test.core.api.espn.com/v2/sports/basketball/leagues/nba"
-        mock_client_instance.request.assert_called_once_with("GET", expected_url, params=None)
+        mock_client_instance.request.assert_called_once_with("GET", expected_url)
         assert result.data == {"league": {"id": "nba"}}
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_athletes(self, mock_client_class, client):
         """Test get_athletes method."""
         mock_client_instance = AsyncMock()
@@ -307,19 +269,18 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"athletes": []}
+        mock_response.content = json.dumps({"athletes": []}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get_athletes("basketball", "nba", team_id="1", limit=25, page=2)
 
         expected_url = "https://test.core.api.espn.com/v2/sports/basketball/leagues/nba/athletes"
         mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"limit": 25, "page": 2, "teams": "1"}
+            "GET", f"{expected_url}?limit=25&page=2&teams=1"
         )
         assert result.data == {"athletes": []}
 
     @patch("httpx.AsyncClient")
-    @pytest.mark.asyncio
     async def test_get_athletes_no_team(self, mock_client_class, client):
         """Test get_athletes method without team filter."""
         mock_client_instance = AsyncMock()
@@ -327,12 +288,81 @@ class TestAsyncESPNClient:
 
         mock_response = MagicMock()
         mock_response.status_code = 200
-        mock_response.json.return_value = {"athletes": []}
+        mock_response.content = json.dumps({"athletes": []}).encode()
         mock_client_instance.request.return_value = mock_response
 
         result = await client.get_athletes("basketball", "nba", limit=100, page=1)
 
         expected_url = "https://test.core.api.espn.com/v2/sports/basketball/leagues/nba/athletes"
         mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"limit": 100, "page": 1}
-        )
\ No newline at end of file
+            "GET", f"{expected_url}?limit=100&page=1"
+        )
+
+    async def test_get_all_athletes(self, client):
+        """Test get_all_athletes fetches remaining pages concurrently."""
+        pages = {
+            1: {"pageCount": 3, "items": [{"id": "1"}]},
+            2: {"pageCount": 3, "items": [{"id": "2"}]},
+            3: {"pageCount": 3, "items": [{"id": "3"}]},
+        }
+        requested = []
+
+        async def fake_get_athletes(sport, league, team_id=None, limit=100, page=1):
+            requested.append(page)
+            return ESPNResponse(data=pages[page], status_code=200, url="u")
+
+        client.get_athletes = fake_get_athletes
+
+        items = await client.get_all_athletes("basketball", "nba", limit=1)
+        assert items == [{"id": "1"}, {"id": "2"}, {"id": "3"}]
+        assert sorted(requested) == [1, 2, 3]
+
+        requested.clear()
+        items = await client.get_all_athletes("basketball", "nba", limit=1, max_pages=2)
+        assert items == [{"id": "1"}, {"id": "2"}]
+        assert sorted(requested) == [1, 2]
+
+
+async def test_get_async_espn_client_singleton():
+    """Default async client is created once per loop, opened eagerly, and closable."""
+    client, again = await asyncio.gather(
+        async_client.get_async_espn_client(), async_client.get_async_espn_client()
+    )
+    assert client is again
+    assert client._client is not None
+
+    await async_client.close_async_espn_client()
+    assert asyncio.get_running_loop() not in async_client._default_async_clients
+    assert client._client is None
+
+
+async def test_close_async_espn_client_waits_for_creation(monkeypatch):
+    """Closing while the default client is being opened closes that client."""
+    aenter = async_client.AsyncESPNClient.__aenter__
+
+    async def slow_aenter(self):
+        await asyncio.sleep(0)
+        return await aenter(self)
+
+    monkeypatch.setattr(async_client.AsyncESPNClient, "__aenter__", slow_aenter)
+
+    client, _ = await asyncio.gather(
+        async_client.get_async_espn_client(), async_client.close_async_espn_client()
+    )
+    assert asyncio.get_running_loop() not in async_client._default_async_clients
+    assert client._client is None
+
+
+def test_get_async_espn_client_per_event_loop():
+    """Each asyncio.run gets a default client bound to its own event loop."""
+
+    async def _use_default_client() -> async_client.AsyncESPNClient:
+        client = await async_client.get_async_espn_client()
+        assert client is await async_client.get_async_espn_client()
+        await async_client.close_async_espn_client()
+        return client
+
+    first = asyncio.run(_use_default_client())
+    second = asyncio.run(_use_default_client())
+    assert first is not second
+    assert first._client is None and second._client is None
@@ -1,38 +1,78 @@
 """Unit tests for synchronous ESPN client."""
 
+import json
+import logging
+from datetime import UTC, datetime, timedelta
+from email.utils import format_datetime
+from types import SimpleNamespace
+
+import httpx
 import pytest
+import structlog
 from unittest.mock import MagicMock, patch
 
-from espnapi.client.base import ESPNEndpointDomain
+from espnapi.client import sync
+from espnapi.client.base import (
+    ESPNEndpointDomain,
+    ESPNResponse,
+    ScoreboardResponse,
+    parse_retry_after,
+)
 from espnapi.client.sync import ESPNClient
 from espnapi.config import ESPNConfig
 from espnapi.exceptions import ESPNClientError, ESPNNotFoundError, ESPNRateLimitError
 
 
+def _resp(status=200, data=None, content=None, headers=None):
+    """Plain-attribute stand-in for an httpx.Response."""
+    if content is None:
+        content = json.dumps(data or {}).encode()
+    return SimpleNamespace(status_code=status, headers=headers or {}, content=content)
+
+
+_BASE_SITE = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba"
+_BASE_CORE = "https://test.core.api.espn.com/v2/sports/basketball/leagues/nba"
+_URL_SCOREBOARD = f"{_BASE_SITE}/scoreboard"
+_URL_TEAMS = f"{_BASE_SITE}/teams"
+_URL_SUMMARY = f"{_BASE_SITE}/summary"
+_URL_ATHLETES = f"{_BASE_CORE}/athletes"
+
+
 class TestESPNClient:
     """Test cases for synchronous ESPN client."""
 
-    @pytest.fixture
-    def config(self):
-        """Test configuration."""
-        return ESPNConfig(
-            site_api_base_url="https://test.api.espn.com",
-            core_api_base_url="https://test.core.api.espn.com",
-            timeout=10.0,
-            max_retries=2,
-        )
-
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def client(self, config):
-        """Test client instance."""
+        """Test client instance shared across the module."""
         return ESPNClient(config)
 
+    @pytest.fixture(autouse=True)
+    def _reset_client(self, client):
+        """Give each test an unopened HTTP client, as lazy-init tests expect."""
+        client._client = None
+        yield
+        client.close()
+
+    @pytest.fixture
+    def mock_api(self, respx_mock):
+        """Route real httpx.Client requests to an in-process mock transport."""
+        return respx_mock
+
     def test_initialization(self, config):
         """Test client initialization."""
         client = ESPNClient(config)
         assert client.config == config
         assert client._client is None  # Lazy initialization
 
+    def test_debug_logging_gated_by_level(self, config):
+        """Test debug logging follows the configured structlog level."""
+        structlog.configure(wrapper_class=structlog.make_filtering_bound_logger(logging.INFO))
+        try:
+            assert ESPNClient(config)._debug_enabled() is False
+        finally:
+            structlog.reset_defaults()
+        assert ESPNClient(config)._debug_enabled() is True
+
     def test_context_manager(self, client):
         """Test context manager usage."""
         with client as c:
@@ -53,6 +93,17 @@ class TestESPNClient:
         mock_client_class.assert_called_once()
         assert http_client == mock_client_instance
 
+    @patch("httpx.Client")
+    def test_client_property_pool_settings(self, mock_client_class, client):
+        """Test HTTP client is built with pool limits and HTTP/2."""
+        assert client.client is mock_client_class.return_value
+
+        kwargs = mock_client_class.call_args.kwargs
+        assert kwargs["http2"] is True
+        assert kwargs["limits"].max_connections == 100
+        assert kwargs["limits"].max_keepalive_connections == 20
+        assert kwargs["follow_redirects"] is False
+
     @patch("httpx.Client")
     def test_client_property_reuse(self, mock_client_class, client):
         """Test that client property reuses existing client."""
@@ -87,238 +138,223 @@ class TestESPNClient:
         assert client._client == mock_client_instance2
         assert mock_client_class.call_count == 2
 
-    def test_build_url_site_domain(self, client):
-        """Test URL building for site domain."""
-        url = client._build_url(ESPNEndpointDomain.SITE, "test/path")
+    @pytest.mark.parametrize(
+        "domain,path,expected",
+        [
+            (ESPNEndpointDomain.SITE, "a/b", "https://test.api.espn.com/a/b"),
+            (ESPNEndpointDomain.SITE, "/a/b", "https://test.api.espn.com/a/b"),
+            (ESPNEndpointDomain.SITE, "//a/b", "https://test.api.espn.com/a/b"),
+            (ESPNEndpointDomain.CORE, "/x", "https://test.core.api.espn.com/x"),
+        ],
+    )
+    def test_build_url(self, client, domain, path, expected):
+        """Test URL building with and without leading slashes."""
+        url = client._build_url(domain, path)
+        assert url == expected
+        assert "//" not in url.removeprefix("https://")
+
+    def test_build_url_base_with_trailing_slash(self):
+        """Test URL building with a configured trailing slash."""
+        client = ESPNClient(ESPNConfig(site_api_base_url="https://test.api.espn.com/"))
+        url = client._build_url(ESPNEndpointDomain.SITE, "/test/path")
         assert url == "https://test.api.espn.com/test/path"
 
-    def test_build_url_core_domain(self, client):
-        """Test URL building for core domain."""
-        url = client._build_url(ESPNEndpointDomain.CORE, "test/path")
-        assert url == "https://test.core.api.espn.com/test/path"
+    def test_append_query(self, client):
+        """Test query strings are encoded, including unhashable values."""
+        assert client._append_query("https://x", {"a": 1, "b": "c d"}) == "https://x?a=1&b=c+d"
+        assert client._append_query("https://x", {"t": ["1", "2"]}) == "https://x?t=1&t=2"
+
+    def test_append_query_encodes_like_httpx(self, client):
+        """Test bools and None are encoded as httpx encodes them."""
+        params = {"active": True, "final": False, "group": None, "ids": [1, True]}
+        url = client._append_query("https://x", params)
+        assert url == "https://x?active=true&final=false&group=&ids=1&ids=true"
+        assert url == str(httpx.URL("https://x", params=params))
+        assert client._append_query("https://x", {"a": 1}) != client._append_query(
+            "https://x", {"a": True}
+        )
 
-    def test_build_url_with_leading_slash(self, client):
-        """Test URL building handles leading slashes."""
-        url = client._build_url(ESPNEndpointDomain.SITE, "/test/path")
-        assert url == "https://test.api.espn.com/test/path"
+    def test_append_query_existing_query(self, client):
+        """Test paths that already carry a query string are extended with '&'."""
+        url = client._append_query("https://x/path?x=1", {"limit": 100})
+        assert url == "https://x/path?x=1&limit=100"
 
-    def test_handle_response_success(self, client):
+    def test_handle_response_success(self, client, mock_response):
         """Test successful response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"test": "data"}
-
         result = client._handle_response(mock_response, "test_url")
 
         assert result.status_code == 200
         assert result.data == {"test": "data"}
         assert result.url == "test_url"
 
-    def test_handle_response_404_error(self, client):
-        """Test 404 response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 404
-
-        with pytest.raises(ESPNNotFoundError, match="ESPN resource not found"):
-            client._handle_response(mock_response, "test_url")
-
-    def test_handle_response_429_error(self, client):
-        """Test 429 response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 429
-
-        with pytest.raises(ESPNRateLimitError, match="ESPN API rate limit exceeded"):
-            client._handle_response(mock_response, "test_url")
-
-    def test_handle_response_500_error(self, client):
-        """Test 500 response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 500
-
-        with pytest.raises(ESPNClientError, match="ESPN server error: 500"):
-            client._handle_response(mock_response, "test_url")
-
-    def test_handle_response_400_error(self, client):
-        """Test 400 response handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 400
-
-        with pytest.raises(ESPNClientError, match="ESPN API error: 400"):
-            client._handle_response(mock_response, "test_url")
+    @pytest.mark.parametrize(
+        "status,exc,match",
+        [
+            (404, ESPNNotFoundError, "ESPN resource not found"),
+            (429, ESPNRateLimitError, "ESPN API rate limit exceeded"),
+            (500, ESPNClientError, "ESPN server error: 500"),
+            (400, ESPNClientError, "ESPN API error: 400"),
+        ],
+    )
+    def test_handle_response_errors(self, client, status, exc, match):
+        """Test error status codes raise the matching exception."""
+        with pytest.raises(exc, match=match):
+            client._handle_response(_resp(status), "test_url")
+
+    def test_handle_response_429_retry_after(self, client):
+        """Test 429 response exposes the Retry-After delay."""
+        with pytest.raises(ESPNRateLimitError) as exc_info:
+            client._handle_response(_resp(429, headers={"Retry-After": "12"}), "test_url")
+        assert exc_info.value.retry_after == 12.0
+
+    def test_handle_response_custom_json_module(self, mock_response):
+        """Test response bodies are decoded with the configured JSON module."""
+        client = ESPNClient(ESPNConfig(json_module=json))
+
+        assert client._json_loads is json.loads
+        assert client._handle_response(mock_response, "test_url").data == {"test": "data"}
+
+    @pytest.mark.parametrize("body", [b'{"x":1}', b'{"events":[{"id":"401","score":"98"}]}'])
+    def test_handle_response_orjson(self, body):
+        """Test orjson decoding matches the stdlib decoder and maps errors the same way."""
+        orjson = pytest.importorskip("orjson")
+        fast = ESPNClient(ESPNConfig(json_module=orjson))
+        stdlib = ESPNClient(ESPNConfig(json_module=json))
+
+        assert fast._handle_response(_resp(content=body), "u").data == (
+            stdlib._handle_response(_resp(content=body), "u").data
+        )
+        with pytest.raises(ESPNClientError, match="Failed to parse ESPN response"):
+            fast._handle_response(_resp(content=body[:-1]), "u")
+
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for delta-seconds and HTTP-dates."""
+        assert parse_retry_after("5") == 5.0
+        assert parse_retry_after("-5") == 0.0
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+        future = format_datetime(datetime.now(UTC) + timedelta(seconds=120), usegmt=True)
+        assert 100 < parse_retry_after(future) <= 120
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("") is None
+        assert parse_retry_after(None) is None
 
     def test_handle_response_json_error(self, client):
         """Test JSON parsing error handling."""
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.side_effect = ValueError("Invalid JSON")
-
         with pytest.raises(ESPNClientError, match="Failed to parse ESPN response"):
-            client._handle_response(mock_response, "test_url")
+            client._handle_response(_resp(content=b"not json"), "test_url")
 
-    @patch("httpx.Client")
-    def test_get_method(self, mock_client_class, client):
+    def test_get_method(self, client, mock_api):
         """Test GET method."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"data": "test"}
-        mock_client_instance.request.return_value = mock_response
+        mock_api.get("https://test.api.espn.com/test/path").respond(200, json={"data": "test"})
 
         result = client.get("test/path", params={"key": "value"})
 
-        mock_client_instance.request.assert_called_once_with(
-            "GET", "https://test.api.espn.com/test/path", params={"key": "value"}
-        )
+        assert mock_api.calls.last.request.url.params == httpx.QueryParams({"key": "value"})
         assert result.data == {"data": "test"}
         assert result.status_code == 200
 
-    @patch("httpx.Client")
-    def test_get_scoreboard(self, mock_client_class, client):
-        """Test get_scoreboard method."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"events": []}
-        mock_client_instance.request.return_value = mock_response
-
-        result = client.get_scoreboard("basketball", "nba", date="20241215", limit=10)
-
-        expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
-        mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"dates": "20241215", "limit": 10}
+    def test_get_retries_transient_errors(self, client, mock_api, monkeypatch):
+        """Test server errors are retried up to max_retries."""
+        route = mock_api.get("https://test.api.espn.com/test/path").mock(
+            side_effect=[httpx.Response(503), httpx.Response(200, json={})]
         )
-        assert result.data == {"events": []}
-
-    @patch("httpx.Client")
-    def test_get_scoreboard_datetime(self, mock_client_class, client):
-        """Test get_scoreboard with datetime object."""
-        from datetime import datetime
+        monkeypatch.setattr(client._retrying, "sleep", lambda seconds: None)
 
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
+        assert client.get("test/path").is_success
+        assert route.call_count == 2
 
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"events": []}
-        mock_client_instance.request.return_value = mock_response
+    def test_get_single_attempt_bypasses_retry(self, mock_api):
+        """Test max_retries <= 1 makes exactly one attempt without tenacity."""
+        route = mock_api.route().respond(503)
 
-        test_date = datetime(2024, 12, 15)
-        result = client.get_scoreboard("basketball", "nba", date=test_date)
+        client = ESPNClient(ESPNConfig(max_retries=1))
+        client._retrying = MagicMock()
 
-        expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/scoreboard"
-        mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"dates": "20241215"}
-        )
-
-    @patch("httpx.Client")
-    def test_get_teams(self, mock_client_class, client):
-        """Test get_teams method."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"teams": []}
-        mock_client_instance.request.return_value = mock_response
-
-        result = client.get_teams("basketball", "nba", limit=50)
-
-        expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/teams"
-        mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"limit": 50}
-        )
-        assert result.data == {"teams": []}
-
-    @patch("httpx.Client")
-    def test_get_team(self, mock_client_class, client):
-        """Test get_team method."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"team": {"id": "1"}}
-        mock_client_instance.request.return_value = mock_response
-
-        result = client.get_team("basketball", "nba", "1")
-
-        expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/teams/1"
-        mock_client_instance.request.assert_called_once_with("GET", expected_url, params=None)
-        assert result.data == {"team": {"id": "1"}}
-
-    @patch("httpx.Client")
-    def test_get_event(self, mock_client_class, client):
-        """Test get_event method."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"event": {"id": "123"}}
-        mock_client_instance.request.return_value = mock_response
-
-        result = client.get_event("basketball", "nba", "123")
-
-        expected_url = "https://test.api.espn.com/apis/site/v2/sports/basketball/nba/summary"
-        mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"event": "123"}
-        )
-        assert result.data == {"event": {"id": "123"}}
-
-    @patch("httpx.Client")
-    def test_get_league_info(self, mock_client_class, client):
-        """Test get_league_info method."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"league": {"id": "nba"}}
-        mock_client_instance.request.return_value = mock_response
-
-        result = client.get_league_info("basketball", "nba")
-
-        expected_url = "https://test.core.api.espn.com/v2/sports/basketball/leagues/nba"
-        mock_client_instance.request.assert_called_once_with("GET", expected_url, params=None)
-        assert result.data == {"league": {"id": "nba"}}
-
-    @patch("httpx.Client")
-    def test_get_athletes(self, mock_client_class, client):
-        """Test get_athletes method."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"athletes": []}
-        mock_client_instance.request.return_value = mock_response
-
-        result = client.get_athletes("basketball", "nba", team_id="1", limit=25, page=2)
-
-        expected_url = "https://test.core.api.espn.com/v2/sports/basketball/leagues/nba/athletes"
-        mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"limit": 25, "page": 2, "teams": "1"}
-        )
-        assert result.data == {"athletes": []}
-
-    @patch("httpx.Client")
-    def test_get_athletes_no_team(self, mock_client_class, client):
-        """Test get_athletes method without team filter."""
-        mock_client_instance = MagicMock()
-        mock_client_class.return_value = mock_client_instance
-
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.json.return_value = {"athletes": []}
-        mock_client_instance.request.return_value = mock_response
-
-        result = client.get_athletes("basketball", "nba", limit=100, page=1)
+        with pytest.raises(ESPNClientError, match="ESPN server error: 503"):
+            client.get("test/path")
+        client.close()
+        assert route.call_count == 1
+        client._retrying.assert_not_called()
+
+    @pytest.mark.parametrize(
+        "method,args,kwargs,expected_url",
+        [
+            (
+                "get_scoreboard",
+                ("basketball", "nba"),
+                {"date": "20241215", "limit": 10},
+                f"{_URL_SCOREBOARD}?dates=20241215&limit=10",
+            ),
+            (
+                "get_scoreboard",
+                ("basketball", "nba"),
+                {"date": datetime(2024, 12, 15)},
+                f"{_URL_SCOREBOARD}?dates=20241215",
+            ),
+            ("get_teams", ("basketball", "nba"), {"limit": 50}, f"{_URL_TEAMS}?limit=50"),
+            ("get_teams", ("basketball", "nba"), {}, f"{_URL_TEAMS}?limit=100"),
+            ("get_team", ("basketball", "nba", "1"), {}, f"{_URL_TEAMS}/1"),
+            ("get_event", ("basketball", "nba", "123"), {}, f"{_URL_SUMMARY}?event=123"),
+            ("get_league_info", ("basketball", "nba"), {}, _BASE_CORE),
+            (
+                "get_athletes",
+                ("basketball", "nba"),
+                {"team_id": "1", "limit": 25, "page": 2},
+                f"{_URL_ATHLETES}?limit=25&page=2&teams=1",
+            ),
+            (
+                "get_athletes",
+                ("basketball", "nba"),
+                {"limit": 100, "page": 1},
+                f"{_URL_ATHLETES}?limit=100&page=1",
+            ),
+        ],
+    )
+    def test_endpoint(self, client, mock_api, method, args, kwargs, expected_url):
+        """Test each endpoint method requests the expected URL."""
+        route = mock_api.route().respond(200, json={"id": "1"})
+
+        result = getattr(client, method)(*args, **kwargs)
+
+        assert route.call_count == 1
+        assert str(route.calls.last.request.url) == expected_url
+        assert result.data == {"id": "1"}
+        assert result.status_code == 200
 
-        expected_url = "https://test.core.api.espn.com/v2/sports/basketball/leagues/nba/athletes"
-        mock_client_instance.request.assert_called_once_with(
-            "GET", expected_url, params={"limit": 100, "page": 1}
-        )
\ No newline at end of file
+    def test_get_scoreboard_returns_scoreboard_response(self, client, mock_api):
+        """Test get_scoreboard wraps the response with scoreboard shortcuts."""
+        mock_api.get(_URL_SCOREBOARD).respond(200, json={"events": []})
+
+        result = client.get_scoreboard("basketball", "nba")
+
+        assert isinstance(result, ScoreboardResponse)
+        assert result.first_event_id is None
+
+    def test_scoreboard_response_first_event_id(self):
+        """Test scoreboard shortcuts read the event list."""
+        data = {"events": [{"id": "401"}, {"id": "402"}]}
+        scoreboard = ScoreboardResponse.wrap(ESPNResponse(data=data, status_code=200, url="u"))
+
+        assert scoreboard.data is data
+        assert scoreboard.first_event_id == "401"
+        assert [event["id"] for event in scoreboard.events] == ["401", "402"]
+        empty = ScoreboardResponse(data={}, status_code=200, url="u")
+        assert empty.first_event_id is None
+        assert empty.events == []
+        no_id = ScoreboardResponse(data={"events": [{"name": "TBD"}]}, status_code=200, url="u")
+        assert no_id.first_event_id is None
+
+
+def test_get_espn_client_singleton(monkeypatch):
+    """Default client is created once and opened eagerly."""
+    monkeypatch.setattr(sync, "_default_client", None)
+    registered = []
+    monkeypatch.setattr(sync.atexit, "register", registered.append)
+
+    client = sync.get_espn_client()
+    try:
+        assert sync.get_espn_client() is client
+        assert client._client is not None
+        assert registered == [client.close]
+    finally:
+        client.close()
@@ -1,5 +1,7 @@
 """Unit tests for ESPNConfig."""
 
+import dataclasses
+
 import pytest
 
 from espnapi.config import ESPNConfig
@@ -14,28 +16,32 @@ class TestESPNConfig:
         assert config.timeout == 30.0
         assert config.max_retries == 3
         assert config.retry_backoff == 1.0
+        assert config.follow_redirects is False
 
-    def test_invalid_timeout(self):
-        """Timeout must be positive."""
-        with pytest.raises(ValueError, match="timeout must be positive"):
-            ESPNConfig(timeout=0)
-
-    def test_invalid_max_retries(self):
-        """Max retries must be non-negative."""
-        with pytest.raises(ValueError, match="max_retries must be non-negative"):
-            ESPNConfig(max_retries=-1)
-
-    def test_invalid_retry_backoff(self):
-        """Retry backoff must be positive."""
-        with pytest.raises(ValueError, match="retry_backoff must be positive"):
-            ESPNConfig(retry_backoff=0)
-
-    def test_invalid_rate_limit_requests(self):
-        """Rate limit requests must be positive."""
-        with pytest.raises(ValueError, match="rate_limit_requests must be positive"):
-            ESPNConfig(rate_limit_requests=0)
-
-    def test_invalid_rate_limit_period(self):
-        """Rate limit period must be positive."""
-        with pytest.raises(ValueError, match="rate_limit_period must be positive"):
-            ESPNConfig(rate_limit_period=0)
+    def test_frozen(self):
+        """Configuration is immutable once created."""
+        config = ESPNConfig()
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            config.timeout = 5.0
+        assert dataclasses.replace(config, timeout=5.0).timeout == 5.0
+
+    @pytest.mark.parametrize(
+        "kwargs,msg",
+        [
+            ({"timeout": 0}, "timeout must be positive"),
+            ({"max_retries": -1}, "max_retries must be non-negative"),
+            ({"retry_backoff": 0}, "retry_backoff must be positive"),
+            ({"retry_jitter": -0.1}, "retry_jitter must be non-negative"),
+            ({"pool_max": 0}, "pool_max must be positive"),
+            ({"pool_keepalive": -1}, "pool_keepalive must be non-negative"),
+            ({"cache_ttl": -1}, "cache_ttl must be non-negative"),
+            ({"cache_maxsize": 0}, "cache_maxsize must be positive"),
+            ({"json_module": pytest}, "json_module must provide a loads"),
+            ({"rate_limit_requests": 0}, "rate_limit_requests must be positive"),
+            ({"rate_limit_period": 0}, "rate_limit_period must be positive"),
+        ],
+    )
+    def test_invalid(self, kwargs, msg):
+        """Invalid settings are rejected with a descriptive error."""
+        with pytest.raises(ValueError, match=msg):
+            ESPNConfig(**kwargs)
@@ -15,54 +15,21 @@ from espnapi.exceptions import (
 class TestExceptions:
     """Test exception classes."""
 
-    def test_base_exception(self):
-        """Test base ESPN service exception."""
-        exc = ESPNServiceError("Test error")
-        assert str(exc) == "Test error"
-        assert isinstance(exc, Exception)
-
-    def test_client_error(self):
-        """Test ESPN client error."""
-        exc = ESPNClientError("API error")
-        assert str(exc) == "API error"
-        assert isinstance(exc, ESPNServiceError)
-
-    def test_rate_limit_error(self):
-        """Test rate limit error."""
-        exc = ESPNRateLimitError("Too many requests")
-        assert str(exc) == "Too many requests"
-        assert isinstance(exc, ESPNClientError)
-        assert isinstance(exc, ESPNServiceError)
-
-    def test_not_found_error(self):
-        """Test not found error."""
-        exc = ESPNNotFoundError("Resource not found")
-        assert str(exc) == "Resource not found"
-        assert isinstance(exc, ESPNClientError)
-        assert isinstance(exc, ESPNServiceError)
-
-    def test_ingestion_error(self):
-        """Test ingestion error."""
-        exc = IngestionError("Ingestion failed")
-        assert str(exc) == "Ingestion failed"
-        assert isinstance(exc, ESPNServiceError)
-
-    def test_validation_error(self):
-        """Test validation error."""
-        exc = ValidationError("Invalid data")
-        assert str(exc) == "Invalid data"
-        assert isinstance(exc, ESPNServiceError)
-
-    def test_exception_hierarchy(self):
-        """Test exception inheritance hierarchy."""
-        # Test that client errors inherit from service error
-        assert issubclass(ESPNClientError, ESPNServiceError)
-        assert issubclass(ESPNRateLimitError, ESPNClientError)
-        assert issubclass(ESPNNotFoundError, ESPNClientError)
-
-        # Test that specific errors inherit from client error
-        assert issubclass(ESPNRateLimitError, ESPNClientError)
-        assert issubclass(ESPNNotFoundError, ESPNClientError)
+    @pytest.mark.parametrize(
+        "child,parent",
+        [
+            (ESPNServiceError, Exception),
+            (ESPNClientError, ESPNServiceError),
+            (ESPNRateLimitError, ESPNClientError),
+            (ESPNNotFoundError, ESPNClientError),
+            (IngestionError, ESPNServiceError),
+            (ValidationError, ESPNServiceError),
+        ],
+    )
+    def test_hierarchy(self, child, parent):
+        """Test each exception's direct parent and message handling."""
+        assert issubclass(child, parent)
+        assert str(child("x")) == "x"
 
     def test_exception_creation(self):
         """Test exception creation and message handling."""
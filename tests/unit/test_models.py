@@ -1,41 +1,73 @@
 """Unit tests for espnapi models."""
 
 import pytest
-from datetime import datetime
-
-from espnapi.models.base import ESPNModel, Link, Logo, Record, Statistic, Address
+from datetime import datetime, timezone
+
+from pydantic import ConfigDict, ValidationError
+
+from espnapi.models.base import (
+    ESPNModel,
+    Link,
+    Logo,
+    Record,
+    Statistic,
+    Address,
+    map_fields,
+    model_list_adapter,
+)
 from espnapi.models.sport import Sport, League, SPORTS, LEAGUES
 from espnapi.models.team import Team
 from espnapi.models.event import Event, Competitor, EventStatus
 from espnapi.models.venue import Venue
 from espnapi.models.athlete import Athlete
 
+NBA = LEAGUES["nba"]
+
+
+class OpenModel(ESPNModel):
+    """ESPN model that opts into free-form extra fields."""
+
+    model_config = ConfigDict(extra="allow")
+
 
 class TestESPNModel:
     """Test base ESPN model functionality."""
 
     def test_basic_model_creation(self):
         """Test basic model creation and validation."""
-        model = ESPNModel(test_field="test_value")
+        model = OpenModel(test_field="test_value")
         assert model.test_field == "test_value"
         assert model.model_dump() == {"test_field": "test_value"}
 
+    def test_extra_fields_ignored_by_default(self):
+        """Test undeclared fields are dropped unless a subclass allows them."""
+        model = ESPNModel(test_field="test_value")
+        assert not hasattr(model, "test_field")
+        assert model.raw_data is None
+        assert model.model_dump() == {}
+
     def test_model_with_raw_data(self):
         """Test model with raw data preservation."""
         raw_data = {"api_field": "value", "extra": "data"}
         model = ESPNModel(raw_data=raw_data)
-        assert model.raw_data == raw_data
+        assert model.raw_data is raw_data
+
+    def test_extra_fields_stored_as_raw_data(self):
+        """Test allowed extra fields are exposed as raw data without copying."""
+        model = OpenModel(test_field="test_value")
+        assert model.raw_data == {"test_field": "test_value"}
+        assert model.raw_data is model.__pydantic_extra__
 
     def test_from_dict_classmethod(self):
         """Test from_dict class method."""
         data = {"name": "Test", "value": 42}
-        model = ESPNModel.from_dict(data)
+        model = OpenModel.from_dict(data)
         assert model.name == "Test"
         assert model.value == 42
 
     def test_to_dict_method(self):
         """Test to_dict method."""
-        model = ESPNModel(name="Test", value=42, none_field=None)
+        model = OpenModel(name="Test", value=42, none_field=None)
         data = model.to_dict(exclude_none=False)
         assert "name" in data and "value" in data and "none_field" in data
         assert data["name"] == "Test"
@@ -116,6 +148,30 @@ class TestBaseModels:
         assert stat.value == 25.5
         assert stat.rank == 1
 
+    def test_leaf_models_frozen_without_raw_data(self):
+        """Test leaf models are immutable and do not store raw data."""
+        link = Link(href="https://example.com", extra_field="ignored")
+        assert "raw_data" not in Link.model_fields
+        assert link.raw_data is None
+        assert link.model_dump() == {"rel": [], "href": "https://example.com", "text": None}
+        with pytest.raises(ValidationError):
+            link.href = "https://other.example.com"
+
+    @pytest.mark.parametrize("model", [Link, Logo, Address, Record, Statistic])
+    def test_leaf_models_slotted(self, model):
+        """Test leaf models add no per-instance slots of their own."""
+        assert model.__slots__ == ()
+        assert "__slots__" in vars(model)
+
+    def test_map_fields(self):
+        """Test ESPN keys are renamed and defaults fill missing fields."""
+        fields = map_fields(
+            {"displayName": "Lakers", "unmapped": 1},
+            {"displayName": "display_name", "abbreviation": "abbreviation"},
+            {"abbreviation": ""},
+        )
+        assert fields == {"display_name": "Lakers", "abbreviation": ""}
+
 
 class TestSportModels:
     """Test Sport and League models."""
@@ -157,15 +213,43 @@ class TestSportModels:
         assert nba.abbreviation == "NBA"
         assert nba.sport.slug == "basketball"
 
+    def test_predefined_mappings_read_only(self):
+        """Test predefined sports and leagues cannot be modified."""
+        with pytest.raises(TypeError):
+            LEAGUES["xfl"] = LEAGUES["nfl"]
+        with pytest.raises(TypeError):
+            SPORTS["cricket"] = SPORTS["golf"]
+
+    def test_get_returns_shared_instances(self):
+        """Test slug lookups return the predefined singletons."""
+        assert Sport.get("basketball") is SPORTS["basketball"]
+        assert League.get("nba") is LEAGUES["nba"]
+        assert League.get("unknown") is None
+
+    def test_sport_league_frozen(self):
+        """Test Sport and League are immutable and hashable."""
+        nba = LEAGUES["nba"]
+        with pytest.raises(ValidationError):
+            nba.name = "Other"
+        assert len({nba, League.get("nba")}) == 1
+        assert hash(nba) == hash("nba")
+        assert "raw_data" not in League.model_fields
+
+    def test_sport_league_reject_unknown_fields(self):
+        """Test Sport and League do not accept undeclared fields."""
+        with pytest.raises(ValidationError):
+            Sport(slug="x", name="X", extra_field=1)
+        with pytest.raises(ValidationError):
+            League(sport=SPORTS["basketball"], slug="x", name="X", extra_field=1)
+
 
 class TestTeamModel:
     """Test Team model."""
 
     def test_team_creation(self):
         """Test Team model creation."""
-        league = LEAGUES["nba"]
         team = Team(
-            league=league,
+            league=NBA,
             espn_id="1",
             abbreviation="LAL",
             display_name="Los Angeles Lakers",
@@ -174,7 +258,7 @@ class TestTeamModel:
             color="552583",
             is_active=True
         )
-        assert team.league == league
+        assert team.league == NBA
         assert team.espn_id == "1"
         assert team.abbreviation == "LAL"
         assert team.display_name == "Los Angeles Lakers"
@@ -186,13 +270,12 @@ class TestTeamModel:
 
     def test_team_primary_logo(self):
         """Test primary logo property."""
-        league = LEAGUES["nba"]
         logos = [
             Logo(href="https://example.com/logo1.png", rel=["alt"]),
             Logo(href="https://example.com/logo2.png", rel=["default"]),
         ]
         team = Team(
-            league=league,
+            league=NBA,
             espn_id="1",
             abbreviation="LAL",
             display_name="Los Angeles Lakers",
@@ -201,12 +284,16 @@ class TestTeamModel:
 
         assert team.primary_logo == "https://example.com/logo2.png"
 
+        # The primary logo follows updates to the logos list
+        assert team.model_copy(update={"logos": []}).primary_logo is None
+        team.logos = logos[:1]
+        assert team.primary_logo == "https://example.com/logo1.png"
+
     def test_team_primary_logo_fallback(self):
         """Test primary logo fallback."""
-        league = LEAGUES["nba"]
         logos = [Logo(href="https://example.com/logo1.png", rel=["alt"])]
         team = Team(
-            league=league,
+            league=NBA,
             espn_id="1",
             abbreviation="LAL",
             display_name="Los Angeles Lakers",
@@ -217,9 +304,8 @@ class TestTeamModel:
 
     def test_team_no_logo(self):
         """Test team with no logos."""
-        league = LEAGUES["nba"]
         team = Team(
-            league=league,
+            league=NBA,
             espn_id="1",
             abbreviation="LAL",
             display_name="Los Angeles Lakers"
@@ -227,24 +313,15 @@ class TestTeamModel:
 
         assert team.primary_logo is None
 
-    def test_team_name_properties(self):
+    def test_team_name_properties(self, lakers_team):
         """Test team name properties."""
-        league = LEAGUES["nba"]
-        team = Team(
-            league=league,
-            espn_id="1",
-            abbreviation="LAL",
-            display_name="Los Angeles Lakers",
-            short_display_name="Lakers",
-            name="Lakers"
-        )
-
-        assert team.team_name == "Lakers"
-        assert team.full_name == "Los Angeles Lakers"
+        assert lakers_team.team_name == "Lakers"
+        assert lakers_team.full_name == "Los Angeles Lakers"
+        assert lakers_team.primary_logo is None
+        assert lakers_team.model_copy(update={"name": "Showtime"}).team_name == "Showtime"
 
     def test_from_espn_data(self):
         """Test creating Team from ESPN data."""
-        league = LEAGUES["nba"]
         espn_data = {
             "id": "1",
             "abbreviation": "LAL",
@@ -256,13 +333,40 @@ class TestTeamModel:
             "links": [{"rel": ["clubhouse"], "href": "https://example.com"}]
         }
 
-        team = Team.from_espn_data(espn_data, league)
+        team = Team.from_espn_data(espn_data, NBA)
 
         assert team.espn_id == "1"
         assert team.abbreviation == "LAL"
         assert team.display_name == "Los Angeles Lakers"
         assert team.logos[0].href == "https://example.com/logo.png"
         assert team.links[0].href == "https://example.com"
+        assert team.raw_data is espn_data
+
+    def test_from_espn_data_many(self):
+        """Test batch-creating Teams from ESPN data."""
+        rows = [
+            {"id": 1, "abbreviation": "LAL", "displayName": "Los Angeles Lakers"},
+            {"team": {"id": "2", "abbreviation": "BOS", "displayName": "Boston Celtics"}},
+        ]
+
+        teams = Team.from_espn_data_many(rows, NBA)
+
+        assert [team.espn_id for team in teams] == ["1", "2"]
+        assert [team.abbreviation for team in teams] == ["LAL", "BOS"]
+        assert all(team.league is NBA for team in teams)
+        assert Team.from_espn_data_many([], NBA) == []
+
+
+class TestModelSchemas:
+    """Test model schemas are built at import time."""
+
+    @pytest.mark.parametrize("model", [Team, Event, Competitor, Venue, Athlete])
+    def test_schemas_prebuilt(self, model):
+        """Test model validators and batch adapters exist before first use."""
+        assert model.__pydantic_complete__
+        misses = model_list_adapter.cache_info().misses
+        model_list_adapter(model)
+        assert model_list_adapter.cache_info().misses == misses
 
 
 class TestVenueModel:
@@ -289,18 +393,17 @@ class TestVenueModel:
         assert venue.capacity == 19580
         assert str(venue) == "TD Garden (Boston, MA)"
 
-    def test_venue_location_properties(self):
+    def test_venue_location_properties(self, td_garden):
         """Test venue location properties."""
-        venue = Venue(
-            espn_id="1",
-            name="TD Garden",
-            city="Boston",
-            state="MA",
-            country="USA"
-        )
+        assert td_garden.location == "Boston, MA, USA"
+        assert td_garden.full_address == "Boston, MA, USA"
+        assert str(td_garden) == "TD Garden (Boston, MA)"
+        assert "location" not in td_garden.model_dump()
 
-        assert venue.location == "Boston, MA, USA"
-        assert venue.full_address == "Boston, MA, USA"
+        moved = td_garden.model_copy(update={"city": "NYC", "state": "NY"})
+        assert moved.location == "NYC, NY, USA"
+        assert moved.full_address == "NYC, NY, USA"
+        assert str(moved) == "TD Garden (NYC, NY)"
 
     def test_venue_with_address(self):
         """Test venue with detailed address."""
@@ -335,6 +438,21 @@ class TestVenueModel:
         assert venue.state == "MA"
         assert venue.capacity == 19580
 
+    def test_from_espn_data_many(self):
+        """Test batch-creating Venues from ESPN data."""
+        rows = [
+            {"id": 1, "fullName": "TD Garden", "address": {"city": "Boston", "zipCode": "02114"}},
+            {"id": "2", "shortName": "Crypto.com Arena", "indoor": True},
+        ]
+
+        venues = Venue.from_espn_data_many(rows)
+
+        assert [venue.espn_id for venue in venues] == ["1", "2"]
+        assert [venue.name for venue in venues] == ["TD Garden", "Crypto.com Arena"]
+        assert isinstance(venues[0].address, Address)
+        assert venues[1].address is None
+        assert Venue.from_espn_data_many([]) == []
+
 
 class TestAthleteModel:
     """Test Athlete model."""
@@ -345,7 +463,7 @@ class TestAthleteModel:
             "id": "1",
             "abbreviation": "LAL",
             "displayName": "Los Angeles Lakers"
-        }, LEAGUES["nba"])
+        }, NBA)
 
         athlete = Athlete(
             espn_id="1",
@@ -367,20 +485,14 @@ class TestAthleteModel:
         assert athlete.team == team
         assert str(athlete) == "LeBron James (LAL)"
 
-    def test_athlete_properties(self):
+    def test_athlete_properties(self, lebron):
         """Test athlete property methods."""
-        athlete = Athlete(
-            espn_id="1",
-            first_name="LeBron",
-            last_name="James",
-            full_name="LeBron James",
-            display_name="LeBron James",
-            position_abbreviation="SF"
-        )
-
-        assert athlete.name == "LeBron James"
-        assert athlete.position_display == "SF"
-        assert athlete.team_name is None  # No team
+        assert lebron.name == "LeBron James"
+        assert lebron.position_display == "SF"
+        assert lebron.team_name == "Los Angeles Lakers"
+        assert str(lebron) == "LeBron James (LAL)"
+        assert lebron.model_copy(update={"display_name": "King James"}).name == "King James"
+        assert lebron.model_copy(update={"position_abbreviation": "PF"}).position_display == "PF"
 
     def test_from_espn_data(self):
         """Test creating Athlete from ESPN data."""
@@ -409,6 +521,8 @@ class TestAthleteModel:
         assert athlete.height == "6'8\""
         assert athlete.weight == 250
         assert athlete.links[0].href == "https://example.com"
+        assert athlete.team_name is None  # No team
+        assert str(athlete) == "LeBron James (FA)"
 
 
 class TestEventModel:
@@ -416,11 +530,10 @@ class TestEventModel:
 
     def test_event_creation(self):
         """Test Event model creation."""
-        league = LEAGUES["nba"]
         event_date = datetime(2024, 12, 15, 20, 0)
 
         event = Event(
-            league=league,
+            league=NBA,
             espn_id="1",
             date=event_date,
             name="Lakers vs Celtics",
@@ -430,7 +543,7 @@ class TestEventModel:
             season_type=2
         )
 
-        assert event.league == league
+        assert event.league == NBA
         assert event.espn_id == "1"
         assert event.date == event_date
         assert event.name == "Lakers vs Celtics"
@@ -442,9 +555,8 @@ class TestEventModel:
 
     def test_event_status_properties(self):
         """Test event status properties."""
-        league = LEAGUES["nba"]
         event = Event(
-            league=league,
+            league=NBA,
             espn_id="1",
             date=datetime.now(),
             name="Test Event",
@@ -458,38 +570,97 @@ class TestEventModel:
         # Test live event
         event.status = EventStatus.IN_PROGRESS
         assert event.is_live is True
+        assert event.display_status == "in progress"
+
+        # Derived properties follow copies with updated fields
+        copied = event.model_copy(update={"status_detail": "Halftime"})
+        assert copied.display_status == "Halftime"
+        assert event.display_status == "in progress"
+
+    def test_from_espn_json(self):
+        """Test creating Event from a raw JSON body."""
+        raw = (
+            b'{"id": "401468034", "date": "2024-01-15T20:00Z", "name": "Lakers at Celtics",'
+            b' "status": {"type": {"state": "in", "detail": "Q3"}}}'
+        )
 
-    def test_competitor_creation(self):
-        """Test Competitor model creation."""
-        league = LEAGUES["nba"]
-        team = Team.from_espn_data({
-            "id": "1",
-            "abbreviation": "LAL",
-            "displayName": "Los Angeles Lakers"
-        }, league)
+        event = Event.from_espn_json(raw, NBA)
 
-        event = Event(
-            league=league,
-            espn_id="1",
-            date=datetime.now(),
-            name="Test Event",
-            season_year=2024
-        )
+        assert event.espn_id == "401468034"
+        assert event.date == datetime(2024, 1, 15, 20, 0, tzinfo=timezone.utc)
+        assert event.is_live is True
+        assert event.display_status == "Q3"
+
+    def test_from_espn_data_with_datetime(self):
+        """Test pre-parsed datetimes are used as-is."""
+        event_date = datetime(2024, 12, 15, 20, 0, tzinfo=timezone.utc)
+        event = Event.from_espn_data({"id": "1", "date": event_date}, NBA)
+        assert event.date == event_date
+        assert event.season_year == 2024
+
+    def test_event_status_lookup(self):
+        """Test status lookup by value with a fallback for unknown values."""
+        assert EventStatus.lookup("final") is EventStatus.FINAL
+        assert EventStatus.lookup("unknown") is EventStatus.SCHEDULED
+        assert EventStatus.lookup("unknown", EventStatus.POSTPONED) is EventStatus.POSTPONED
 
+    def test_competitor_creation(self, sample_event, lakers_team):
+        """Test Competitor model creation."""
         competitor = Competitor(
-            event=event,
-            team=team,
+            event=sample_event,
+            team=lakers_team,
             home_away="home",
             score="100",
             winner=True
         )
 
-        assert competitor.event == event
-        assert competitor.team == team
+        assert competitor.event is sample_event
+        assert competitor.team is lakers_team
         assert competitor.home_away == "home"
         assert competitor.score == "100"
         assert competitor.winner is True
         assert competitor.score_int == 100
+        assert competitor.model_copy(update={"score": "104"}).score_int == 104
         assert competitor.is_home is True
         assert competitor.is_away is False
-        assert str(competitor) == "LAL (home) - Test Event"
\ No newline at end of file
+        assert str(competitor) == "LAL (home) - LAL @ BOS"
+
+    @pytest.mark.parametrize(
+        ("score", "expected"),
+        [("100", 100), ("", None), ("-3", -3), ("DNP", None)],
+    )
+    def test_competitor_score_int(self, score, expected, sample_event, lakers_team):
+        """Test score parsing for numeric, empty and non-numeric scores."""
+        competitor = Competitor(
+            event=sample_event, team=lakers_team, home_away="away", score=score
+        )
+
+        assert competitor.score_int == expected
+
+    def test_competitor_from_espn_data_many(self):
+        """Test batch-creating Competitors with nested teams from ESPN data."""
+        event = Event.from_espn_data(
+            {"id": "1", "date": "2024-01-15T20:00Z", "name": "Test Event"}, NBA
+        )
+        rows = [
+            {
+                "team": {"id": "1", "abbreviation": "LAL", "displayName": "Los Angeles Lakers"},
+                "homeAway": "away",
+                "score": "98",
+                "records": [{"type": "total", "summary": "10-5"}],
+            },
+            {
+                "team": {"id": "2", "abbreviation": "BOS", "displayName": "Boston Celtics"},
+                "homeAway": "home",
+                "score": "101",
+                "winner": True,
+            },
+        ]
+
+        competitors = Competitor.from_espn_data_many(rows, event, NBA)
+
+        assert [c.team.abbreviation for c in competitors] == ["LAL", "BOS"]
+        assert all(c.event is event for c in competitors)
+        assert competitors[0].records[0].summary == "10-5"
+        assert competitors[1].winner is True
+        assert Competitor.from_espn_data(rows[1], event, NBA).score_int == 101
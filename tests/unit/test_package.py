@@ -0,0 +1,20 @@
+"""Unit tests for package layout."""
+
+from pathlib import Path
+
+import espnapi
+
+PACKAGE_DIR = Path(espnapi.__file__).resolve().parent
+
+
+class TestPackageLayout:
+    """Guard against the nested shadow copy of the package coming back."""
+
+    def test_no_nested_package(self):
+        """The package must not contain a nested espnapi package."""
+        assert not (PACKAGE_DIR / "espnapi").exists()
+
+    def test_no_project_files_in_package(self):
+        """Project-level files belong at the repository root, not in the package."""
+        for name in ("pyproject.toml", "uv.lock", "tests", "main.py"):
+            assert not (PACKAGE_DIR / name).exists(), name
@@ -1,8 +1,10 @@
 """Unit tests for retry helpers."""
 
 import pytest
+from tenacity import RetryCallState
 
 from espnapi.client.retry import (
+    MAX_RETRY_AFTER,
     async_retry_request,
     create_retry_config,
     retry_request,
@@ -15,12 +17,55 @@ from espnapi.exceptions import ESPNClientError, ESPNRateLimitError
 class TestRetryHelpers:
     """Test retry helpers."""
 
+    @pytest.fixture(autouse=True)
+    def no_backoff_sleep(self, monkeypatch):
+        """Make tenacity backoff sleeps no-ops so retries cost no wall time."""
+        sleeps = []
+
+        async def _fake_async_sleep(seconds, *args, **kwargs):
+            sleeps.append(seconds)
+
+        monkeypatch.setattr("tenacity.nap.time.sleep", sleeps.append)
+        monkeypatch.setattr("asyncio.sleep", _fake_async_sleep)
+        return sleeps
+
     def test_create_retry_config(self):
         """Retry config uses config values."""
         config = ESPNConfig(max_retries=5, retry_backoff=2.0)
         retry_config = create_retry_config(config)
         assert retry_config["stop"].max_attempt_number == 5
-        assert retry_config["wait"].multiplier == 2.0
+        backoff, jitter = retry_config["wait"].fallback.wait_funcs
+        assert backoff.multiplier == 2.0
+        assert jitter.wait_random_max == 2.0
+
+    def test_create_retry_config_cached(self):
+        """Equal retry settings share strategies but not the returned dict."""
+        first = create_retry_config(ESPNConfig(max_retries=4, user_agent="a"))
+        second = create_retry_config(ESPNConfig(max_retries=4, user_agent="b"))
+        assert first is not second
+        assert first["wait"] is second["wait"]
+        assert create_retry_config(ESPNConfig(max_retries=2))["stop"] is not first["stop"]
+
+    def test_create_retry_config_custom_jitter(self):
+        """Retry config honors an explicit jitter bound."""
+        config = ESPNConfig(retry_backoff=2.0, retry_jitter=0.5)
+        retry_config = create_retry_config(config)
+        _, jitter = retry_config["wait"].fallback.wait_funcs
+        assert jitter.wait_random_max == 0.5
+
+    def test_wait_honors_retry_after(self):
+        """Server-provided Retry-After overrides the backoff, capped at the max."""
+        wait = create_retry_config(ESPNConfig(retry_backoff=0.01))["wait"]
+
+        def state_for(exc):
+            retry_state = RetryCallState(None, None, (), {})
+            retry_state.set_exception((type(exc), exc, None))
+            return retry_state
+
+        assert wait(state_for(ESPNRateLimitError("x", retry_after=7.0))) == 7.0
+        assert wait(state_for(ESPNRateLimitError("x", retry_after=3600.0))) == MAX_RETRY_AFTER
+        assert wait(state_for(ESPNRateLimitError("x"))) < 1.0
+        assert wait(state_for(ESPNClientError("x"))) < 1.0
 
     def test_should_retry_exception(self):
         """Retry eligibility for exceptions."""
@@ -28,7 +73,7 @@ class TestRetryHelpers:
         assert should_retry_exception(ESPNRateLimitError("x"))
         assert not should_retry_exception(ValueError("x"))
 
-    def test_retry_request_success_after_failures(self):
+    def test_retry_request_success_after_failures(self, no_backoff_sleep):
         """Retry succeeds after transient failures."""
         config = ESPNConfig(max_retries=3, retry_backoff=0.01)
         attempts = {"count": 0}
@@ -42,9 +87,9 @@ class TestRetryHelpers:
 
         assert flaky() == "ok"
         assert attempts["count"] == 3
+        assert len(no_backoff_sleep) == 2
 
-    @pytest.mark.asyncio
-    async def test_async_retry_request_success_after_failures(self):
+    async def test_async_retry_request_success_after_failures(self, no_backoff_sleep):
         """Async retry succeeds after transient failures."""
         config = ESPNConfig(max_retries=3, retry_backoff=0.01)
         attempts = {"count": 0}
@@ -58,3 +103,4 @@ class TestRetryHelpers:
 
         assert await flaky_async() == "ok"
         assert attempts["count"] == 3
+        assert len(no_backoff_sleep) == 2
@@ -1,9 +1,39 @@
 """Unit tests for espnapi utils."""
 
-from datetime import datetime
+import math
+import sys
+from datetime import date, datetime, timedelta
+from enum import StrEnum
+from fractions import Fraction
+from http import HTTPStatus
+from types import SimpleNamespace
+
+import pytest
+from hypothesis import given, settings
+from hypothesis import strategies as st
 
 from espnapi import utils
 
+# Keep property tests cheap enough to run with the unit suite
+_PROPERTY_SETTINGS = settings(max_examples=50, deadline=None)
+
+# Trimmed get_teams response: sports[].leagues[].teams[].team
+_TEAMS_PAYLOAD = {
+    "sports": [
+        {
+            "name": "Basketball",
+            "leagues": [
+                {
+                    "teams": [
+                        {"team": {"id": "13", "abbreviation": "LAL"}},
+                        {"team": {"id": "2", "abbreviation": "BOS"}},
+                    ]
+                }
+            ],
+        }
+    ]
+}
+
 
 class TestUtils:
     """Test utility helpers."""
@@ -15,12 +45,22 @@ class TestUtils:
         assert dt.year == 2024
         assert dt.month == 1
         assert dt.day == 1
+        assert dt.utcoffset() == timedelta(0)
+
+    def test_parse_datetime_none(self):
+        """Parse a missing value returns fallback."""
+        assert isinstance(utils.parse_datetime(None), datetime)
 
     def test_parse_datetime_invalid(self):
         """Parse invalid datetime returns fallback."""
         dt = utils.parse_datetime("not-a-date")
         assert isinstance(dt, datetime)
 
+    def test_format_espn_date(self):
+        """Format dates and datetimes as YYYYMMDD."""
+        assert utils.format_espn_date(datetime(2024, 12, 15, 19, 30)) == "20241215"
+        assert utils.format_espn_date(date(2024, 1, 5)) == "20240105"
+
     def test_safe_int(self):
         """Safe int conversion."""
         assert utils.safe_int("10") == 10
@@ -31,6 +71,62 @@ class TestUtils:
         assert utils.safe_float("3.14") == 3.14
         assert utils.safe_float("bad", default=1.5) == 1.5
 
+    @_PROPERTY_SETTINGS
+    @given(st.one_of(st.integers(), st.floats(), st.text(), st.none()))
+    def test_safe_int_property(self, value):
+        """Safe int matches int() and falls back to the default on failure."""
+        try:
+            expected = int(value)
+        except (ValueError, TypeError, OverflowError):
+            expected = -1
+        else:
+            assert isinstance(utils.safe_int(value, default=-1), int)
+        assert utils.safe_int(value, default=-1) == expected
+
+    @_PROPERTY_SETTINGS
+    @given(st.one_of(st.integers(), st.floats(), st.text(), st.none()))
+    def test_safe_float_property(self, value):
+        """Safe float matches float() and falls back to the default on failure."""
+        try:
+            expected = float(value)
+        except (ValueError, TypeError, OverflowError):
+            expected = -1.0
+        result = utils.safe_float(value, default=-1.0)
+        assert isinstance(result, float)
+        assert result == expected or (math.isnan(result) and math.isnan(expected))
+
+    @_PROPERTY_SETTINGS
+    @given(st.one_of(st.booleans(), st.integers(), st.floats(), st.text(), st.none()))
+    def test_safe_bool_property(self, value):
+        """Safe bool always returns a bool and only uses the default for other types."""
+        result = utils.safe_bool(value, default=True)
+        assert isinstance(result, bool)
+        if isinstance(value, str):
+            assert result is (value.lower() in utils._TRUTHY)
+        elif value is None:
+            assert result is True
+        else:
+            assert result is bool(value)
+
+    def test_safe_float_list(self):
+        """Batch float conversion returns a list of floats."""
+        values = ["1.5", 2, None, "bad", ""]
+        assert utils.safe_float_list(values, default=-1.0) == [1.5, 2.0, -1.0, -1.0, -1.0]
+        assert utils.safe_float_list([]) == []
+
+    def test_safe_float_array(self):
+        """Batch float conversion returns a float64 array with numpy."""
+        np = pytest.importorskip("numpy")
+        result = utils.safe_float_array(["1.5", None, 3])
+        assert result.dtype == np.float64
+        assert result.tolist() == [1.5, 0.0, 3.0]
+
+    def test_safe_float_array_without_numpy(self, monkeypatch):
+        """Batch array conversion requires numpy."""
+        monkeypatch.setattr(utils, "np", None)
+        with pytest.raises(ImportError, match="numpy"):
+            utils.safe_float_array([1])
+
     def test_safe_str(self):
         """Safe string conversion."""
         assert utils.safe_str(123) == "123"
@@ -43,9 +139,83 @@ class TestUtils:
         assert utils.safe_bool("false") is False
         assert utils.safe_bool(0) is False
         assert utils.safe_bool(1) is True
+        assert utils.safe_bool("Y") is True
+        assert utils.safe_bool(0.0) is False
+        assert utils.safe_bool(None, default=True) is True
+
+    def test_safe_bool_subclasses(self):
+        """Safe bool converts int, float and str subclasses instead of using the default."""
+        assert utils.safe_bool(HTTPStatus.OK) is True
+        assert utils.safe_bool(StrEnum("Flag", {"ON": "yes"}).ON) is True
+        assert utils.safe_bool(Fraction(0)) is False
+        assert utils.safe_bool(object(), default=True) is True
+
+    def test_safe_bool_numpy(self):
+        """Safe bool converts numpy scalars."""
+        np = pytest.importorskip("numpy")
+        assert utils.safe_bool(np.float64(0.5)) is True
+        assert utils.safe_bool(np.int64(0), default=True) is False
+        assert utils.safe_bool(np.bool_(True)) is True
+        assert utils.safe_bool(np.bool_(False), default=True) is False
 
     def test_extract_nested_value(self):
         """Extract nested values safely."""
         data = {"a": {"b": {"c": 1}}}
         assert utils.extract_nested_value(data, ["a", "b", "c"]) == 1
         assert utils.extract_nested_value(data, ["a", "x"], default=0) == 0
+
+    def test_path(self):
+        """Compiled path accessors match extract_nested_value."""
+        get_c = utils.path("a", "b", "c", default=0)
+        assert get_c({"a": {"b": {"c": 1}}}) == 1
+        assert get_c({"a": {"x": {}}}) == 0
+        assert get_c({"a": None}) == 0
+        assert utils.path("a")({"a": 2}) == 2
+
+    @pytest.mark.parametrize(
+        "keys,expected",
+        [
+            (("sports", 0, "leagues", 0, "teams", 0, "team", "id"), "13"),
+            (("sports", 0, "leagues", 0, "teams", -1, "team", "abbreviation"), "BOS"),
+            (("sports", 0, "name"), "Basketball"),
+            (("sports", 1, "name"), None),
+            (("sports", 0, "leagues", "teams"), None),
+            (("missing", 0), None),
+            (("sports", 0, "name", 0), "B"),
+        ],
+    )
+    def test_path_indexes(self, keys, expected):
+        """Integer keys index into lists along ESPN's nested response shape."""
+        assert utils.path(*keys)(_TEAMS_PAYLOAD) == expected
+
+    def test_path_invalid_keys(self):
+        """Path requires at least one string or integer key."""
+        with pytest.raises(ValueError):
+            utils.path()
+        with pytest.raises(TypeError):
+            utils.path("a", 1.5)  # type: ignore[arg-type]
+        with pytest.raises(TypeError):
+            utils.path("a", True)
+
+    def test_install_uvloop(self, monkeypatch):
+        """uvloop policy is installed only when available."""
+        policies = []
+        monkeypatch.setattr(utils.asyncio, "set_event_loop_policy", policies.append)
+        monkeypatch.setattr(utils.sys, "platform", "linux")
+
+        monkeypatch.setitem(sys.modules, "uvloop", None)
+        assert utils.install_uvloop() is False
+
+        fake_uvloop = SimpleNamespace(EventLoopPolicy=lambda: "uvloop-policy")
+        monkeypatch.setitem(sys.modules, "uvloop", fake_uvloop)
+        assert utils.install_uvloop() is True
+        assert policies == ["uvloop-policy"]
+
+        monkeypatch.setattr(utils.sys, "platform", "win32")
+        assert utils.install_uvloop() is False
+
+    async def test_install_uvloop_running_loop(self, monkeypatch):
+        """uvloop is never forced onto an already running loop."""
+        monkeypatch.setattr(utils.sys, "platform", "linux")
+        monkeypatch.setitem(sys.modules, "uvloop", SimpleNamespace(EventLoopPolicy=object))
+        assert utils.install_uvloop() is False